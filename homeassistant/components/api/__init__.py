@@ -216,7 +216,7 @@ class APIStatesView(HomeAssistantView):
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            body = hass.states.async_all_as_dict_json()
         else:
             entity_perm = user.permissions.check_entity
             states = (
@@ -224,8 +224,9 @@ class APIStatesView(HomeAssistantView):
                 for state in hass.states.async_all()
                 if entity_perm(state.entity_id, "read")
             )
+            body = b"".join((b"[", b",".join(states), b"]"))
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=body,
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
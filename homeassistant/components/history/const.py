@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The number of entities fetched and sent in each
+# message when a history stream is chunked
+HISTORY_CHUNK_ENTITIES = 25
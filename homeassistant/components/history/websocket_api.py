@@ -39,7 +39,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_ENTITIES,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -277,8 +281,23 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    chunked: bool = False,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
+    if chunked and entity_ids:
+        return await _async_send_historical_states_in_chunks(
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+        )
     instance = get_instance(hass)
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
@@ -298,6 +317,64 @@ async def _async_send_historical_states(
     return last_time_dt if last_time_ts != 0 else None
 
 
+async def _async_send_historical_states_in_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+) -> dt | None:
+    """Fetch history significant_states and send them to the client in chunks.
+
+    Each chunk only has the states of HISTORY_CHUNK_ENTITIES entities
+    so the size of each message is bounded and the client gets the
+    first message without waiting for the states of all the entities.
+    """
+    instance = get_instance(hass)
+    last_time_ts = 0.0
+    last_time_dt: dt | None = None
+    for idx in range(0, len(entity_ids), HISTORY_CHUNK_ENTITIES):
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            break
+        (
+            chunk_last_time_ts,
+            chunk_last_time_dt,
+            payload,
+        ) = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids[idx : idx + HISTORY_CHUNK_ENTITIES],
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            False,
+        )
+        if payload:
+            connection.send_message(payload)
+        if chunk_last_time_ts > last_time_ts:
+            last_time_ts = chunk_last_time_ts
+            last_time_dt = chunk_last_time_dt
+    if last_time_dt is None and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        connection.send_message(
+            _generate_websocket_response(msg_id, start_time, end_time, {})
+        )
+    return last_time_dt
+
+
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
     """Convert a state to a compressed state."""
     comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state.state}
@@ -405,6 +482,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -444,6 +522,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    chunked = msg["chunked"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -470,6 +549,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            chunked,
         )
         return
 
@@ -534,6 +614,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        chunked,
     )
 
     if msg_id not in connection.subscriptions:
@@ -578,4 +659,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        chunked=chunked,
     )
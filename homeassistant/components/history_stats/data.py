@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
@@ -51,6 +53,10 @@ class HistoryStats:
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
         self._previous_run_before_start = False
+        # State changes after the end of the period are not added to the
+        # history, so the history can only slide forward when the previous
+        # run was not after the end of the period
+        self._previous_run_after_end = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
@@ -80,6 +86,8 @@ class HistoryStats:
         previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
+        previous_run_after_end = self._previous_run_after_end
+        self._previous_run_after_end = current_period_end_timestamp < now_timestamp
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
@@ -91,13 +99,26 @@ class HistoryStats:
         # We avoid querying the database if the below did NOT happen:
         #
         # - The previous run happened before the start time
-        # - The start time changed
+        # - The start time moved back
         # - The period shrank in size
         # - The previous period ended before now
         #
+        # When the start time moved forward within the previous period,
+        # the history before the new start time is dropped instead, as
+        # the history since the previous start time is already known,
+        # unless the previous run was after the end of the previous period.
+        #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and (
+                current_period_start_timestamp == previous_period_start_timestamp
+                or (
+                    not previous_run_after_end
+                    and previous_period_start_timestamp
+                    < current_period_start_timestamp
+                    < previous_period_end_timestamp
+                )
+            )
             and (
                 current_period_end_timestamp == previous_period_end_timestamp
                 or (
@@ -107,6 +128,9 @@ class HistoryStats:
             )
         ):
             new_data = False
+            if current_period_start_timestamp != previous_period_start_timestamp:
+                self._async_slide_history_start(current_period_start_timestamp)
+                new_data = True
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
                     current_period_start_timestamp
@@ -154,6 +178,22 @@ class HistoryStats:
             for state in states
         ]
 
+    def _async_slide_history_start(self, start_timestamp: float) -> None:
+        """Drop the history before the new start of the period.
+
+        The last state before the new start becomes the state at the start.
+        """
+        history_current_period = self._history_current_period
+        # The first history state is the state at the previous start time
+        # so every state before the new start time is in the history
+        if idx := bisect_right(
+            history_current_period, start_timestamp, key=attrgetter("last_changed")
+        ):
+            del history_current_period[: idx - 1]
+            history_current_period[0] = HistoryState(
+                history_current_period[0].state, start_timestamp
+            )
+
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
     ) -> list[State]:
@@ -116,6 +116,9 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Maximum number of topics to cache matching subscriptions for
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -266,12 +269,95 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """Node in the wildcard subscription trie, keyed by topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Trie of wildcard subscriptions used to match incoming topics.
+
+    Matching a topic only walks the levels of the topic and the
+    branches with a matching level, `+` or `#`, instead of testing
+    every wildcard subscription.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        node = self._root
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        # Prune the branch up to the first node that is still in use
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription for exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Topics starting with $ should not match wildcards at the first level
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            if (normal or index) and (multi_level := children.get("#")):
+                matches.extend(multi_level.subscriptions)
+            if index == num_levels:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if (normal or index) and (single_level := children.get("+")):
+                stack.append((single_level, index + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,6 +462,7 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscription_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -623,8 +710,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscription_trie.has_topic(topic)
         )
 
     async def async_publish(
@@ -754,6 +842,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscription_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -772,6 +861,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -834,9 +924,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1030,18 +1119,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscription_trie.match(topic))
         return subscriptions
 
     @callback
@@ -1233,13 +1317,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -17,7 +17,7 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
@@ -25,6 +25,11 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import (
+    async_get_render_profiler,
+    async_start_render_profiler,
+    async_stop_render_profiler,
+)
 
 from .const import DOMAIN
 
@@ -40,6 +45,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_TEMPLATE_PROFILER = "start_template_profiler"
+SERVICE_STOP_TEMPLATE_PROFILER = "stop_template_profiler"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,15 +70,20 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_TEMPLATE_PROFILER,
+    SERVICE_STOP_TEMPLATE_PROFILER,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+DEFAULT_SAMPLE_INTERVAL = 10
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_SAMPLE_INTERVAL = "sample_interval"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -273,6 +285,20 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_start_template_profiler(call: ServiceCall) -> None:
+        """Start recording the render statistics of templates."""
+        if async_get_render_profiler(hass) is not None:
+            raise HomeAssistantError("Template profiling already started")
+        async_start_render_profiler(hass, call.data[CONF_SAMPLE_INTERVAL])
+
+    @callback
+    def _async_stop_template_profiler(call: ServiceCall) -> None:
+        """Stop recording the render statistics of templates."""
+        if async_get_render_profiler(hass) is None:
+            raise HomeAssistantError("Template profiling not running")
+        async_stop_render_profiler(hass)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +408,29 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_TEMPLATE_PROFILER,
+        _async_start_template_profiler,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000))
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_TEMPLATE_PROFILER,
+        _async_stop_template_profiler,
+    )
+
+    websocket_api.async_register_command(hass, websocket_template_stats)
+
     return True
 
 
@@ -391,10 +440,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    async_stop_render_profiler(hass)
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/template_stats"})
+@callback
+def websocket_template_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the render statistics of templates."""
+    profiler = async_get_render_profiler(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "running": profiler is not None,
+            "templates": profiler.async_get_stats() if profiler else [],
+        },
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,21 @@
+"""Diagnostics support for the profiler integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.service import async_get_target_resolution_stats
+from homeassistant.helpers.template import async_get_render_profiler
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    profiler = async_get_render_profiler(hass)
+    return {
+        "template_renders": profiler.async_get_stats() if profiler else None,
+        "target_resolution_cache": async_get_target_resolution_stats(hass),
+    }
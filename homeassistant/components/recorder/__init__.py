@@ -51,6 +51,7 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_HISTORY_CACHE_SIZE = 0
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -61,6 +62,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_HISTORY_CACHE_SIZE = "history_cache_size"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -113,6 +115,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_SIZE, default=DEFAULT_HISTORY_CACHE_SIZE
+                    ): cv.positive_int,
                 }
             ),
         )
@@ -142,6 +147,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    history_cache_size = conf[CONF_HISTORY_CACHE_SIZE]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -163,6 +169,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        history_cache_size=history_cache_size,
     )
     get_instance.cache_clear()
     instance.async_initialize()
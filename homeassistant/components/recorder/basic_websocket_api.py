@@ -37,6 +37,12 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        average_event_block_size = instance.average_event_block_size
+        max_event_block_size = instance.max_event_block_size
+        event_latency = instance.event_latency
+        purge_progress = (
+            progress.as_dict() if (progress := instance.purge_progress) else None
+        )
     else:
         backlog = None
         migration_in_progress = False
@@ -44,12 +50,20 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        average_event_block_size = None
+        max_event_block_size = None
+        event_latency = None
+        purge_progress = None
 
     recorder_info = {
+        "average_event_block_size": average_event_block_size,
         "backlog": backlog,
+        "event_latency": event_latency,
         "max_backlog": max_backlog,
+        "max_event_block_size": max_event_block_size,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress,
         "recording": recording,
         "thread_running": is_running,
     }
@@ -0,0 +1,189 @@
+"""Batch the rows written by the recorder thread into multi-row inserts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any, cast
+
+from sqlalchemy import Column, Table, insert, update
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Rows are inserted in this order so the ids of the rows
+# a row refers to are always known before the row itself is inserted.
+INSERT_ORDER: tuple[type[Base], ...] = (
+    EventTypes,
+    EventData,
+    StatesMeta,
+    StateAttributes,
+    Events,
+    States,
+)
+
+
+def _link_events(events: list[Events]) -> list[Events]:
+    """Resolve the foreign keys of pending Events from their relationships."""
+    for event in events:
+        if (event_type := event.event_type_rel) is not None:
+            event.event_type_id = event_type.event_type_id
+        if (event_data := event.event_data_rel) is not None:
+            event.data_id = event_data.data_id
+    return []
+
+
+def _link_states(states: list[States]) -> list[States]:
+    """Resolve the foreign keys of pending States from their relationships.
+
+    Returns the states whose old state is inserted in the same flush,
+    as its id is only known after the insert.
+    """
+    inserted_with = {id(state) for state in states}
+    unlinked: list[States] = []
+    for state in states:
+        if (old_state := state.old_state) is not None:
+            if id(old_state) in inserted_with:
+                unlinked.append(state)
+            else:
+                state.old_state_id = old_state.state_id
+        if (state_attributes := state.state_attributes) is not None:
+            state.attributes_id = state_attributes.attributes_id
+        if (states_meta := state.states_meta_rel) is not None:
+            state.metadata_id = states_meta.metadata_id
+    return unlinked
+
+
+def _link_old_states(session: Session, states: list[States]) -> None:
+    """Set the old_state_id of states whose old state was inserted with them."""
+    session.execute(
+        update(States),
+        [
+            {
+                "state_id": state.state_id,
+                "old_state_id": cast(States, state.old_state).state_id,
+            }
+            for state in states
+        ],
+    )
+
+
+_LINKERS: dict[type[Base], Callable[[Any], list[Any]]] = {
+    Events: _link_events,
+    States: _link_states,
+}
+
+
+class _TableInserter:
+    """Insert pending rows of one table and read back their ids."""
+
+    __slots__ = ("primary_key_key", "keys", "values_getter", "statement")
+
+    def __init__(self, table_cls: type[Base]) -> None:
+        """Initialize the table inserter."""
+        table = cast(Table, table_cls.__table__)
+        primary_key: Column[int] = next(iter(table.primary_key.columns))
+        self.primary_key_key = primary_key.key
+        # The database assigns the primary key
+        self.keys = tuple(
+            column.key for column in table.columns if column is not primary_key
+        )
+        values_getter = attrgetter(*self.keys)
+        if len(self.keys) == 1:
+            # attrgetter only returns a tuple for multiple attributes
+            self.values_getter: Callable[[Any], tuple[Any, ...]] = lambda row: (
+                values_getter(row),
+            )
+        else:
+            self.values_getter = values_getter
+        self.statement = insert(table).returning(
+            primary_key, sort_by_parameter_order=True
+        )
+
+    def insert(self, session: Session, rows: list[Any]) -> None:
+        """Insert the rows with a single executemany and set their ids."""
+        keys = self.keys
+        values_getter = self.values_getter
+        ids = session.execute(
+            self.statement,
+            [dict(zip(keys, values_getter(row), strict=True)) for row in rows],
+        ).scalars()
+        key = self.primary_key_key
+        for row, id_ in zip(rows, ids, strict=True):
+            setattr(row, key, id_)
+
+
+def supports_dialect(dialect: Dialect) -> bool:
+    """Return if the database can return the ids of an executemany insert.
+
+    SQLite 3.35+, MariaDB 10.5+ and PostgreSQL can, MySQL can not.
+    """
+    return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class BulkInserter:
+    """Collect the rows of a commit interval and insert them in bulk.
+
+    Rows are the same ORM objects the table managers keep track of, but
+    they are never added to the session. Instead of going through the
+    unit of work on commit, each table is written with one executemany
+    which returns the ids the database assigned, in the order of the
+    rows, so the rows referring to them can be linked before they are
+    inserted. Only used with databases which support INSERT..RETURNING
+    for executemany, see supports_dialect.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk inserter."""
+        self._pending: dict[type[Base], list[Any]] = {
+            table_cls: [] for table_cls in INSERT_ORDER
+        }
+        self._inserters = {
+            table_cls: _TableInserter(table_cls) for table_cls in INSERT_ORDER
+        }
+
+    def add(self, row: Base) -> None:
+        """Add a row to be inserted on the next flush.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending[type(row)].append(row)
+
+    def flush(self, session: Session) -> None:
+        """Insert all pending rows in the session's transaction.
+
+        The pending rows are kept until clear is called so the flush can
+        be retried if the commit fails.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for table_cls, rows in self._pending.items():
+            if not rows:
+                continue
+            inserter = self._inserters[table_cls]
+            unlinked: list[Any] = []
+            if linker := _LINKERS.get(table_cls):
+                unlinked = linker(rows)
+            inserter.insert(session, rows)
+            if unlinked:
+                _link_old_states(session, unlinked)
+
+    def clear(self) -> None:
+        """Clear the pending rows after they have been committed or discarded.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for rows in self._pending.values():
+            rows.clear()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -49,7 +49,8 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, purge, statistics
+from .bulk_insert import BulkInserter, supports_dialect
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -79,6 +80,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -174,6 +176,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_size: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -187,7 +190,21 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._queue: queue.SimpleQueue[RecorderTask | Event | list[Event]] = (
+            queue.SimpleQueue()
+        )
+        # Events are collected in the event loop and handed off
+        # to the recorder thread in blocks
+        self._pending_events: list[Event] = []
+        # Only changed in the event loop
+        self._event_blocks_queued = 0
+        self._events_queued = 0
+        self.max_event_block_size = 0
+        # Only changed in the recorder thread
+        self._event_blocks_processed = 0
+        self._events_processed = 0
+        # Seconds from firing to writing the oldest event of the last block
+        self.event_latency = 0.0
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -213,6 +230,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_inserter: BulkInserter | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -221,6 +239,15 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.hourly_statistics_rollup = statistics.HourlyStatisticsRollup()
+        self.purge_progress: purge.PurgeProgress | None = None
+
+        # Recently recorded states are kept in memory to answer
+        # history queries for recent periods without the database
+        self.history_cache: HistoryCache | None = (
+            HistoryCache(history_cache_size) if history_cache_size else None
+        )
+        self._history_cache_pending: list[tuple[States, str]] = []
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -251,7 +278,21 @@ class Recorder(threading.Thread):
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        # Each block of events is one item in the queue
+        return max(
+            self._queue.qsize()
+            - (self._event_blocks_queued - self._event_blocks_processed)
+            + (self._events_queued - self._events_processed)
+            + len(self._pending_events),
+            0,
+        )
+
+    @property
+    def average_event_block_size(self) -> float:
+        """Return the average number of events handed off in one block."""
+        if not self._event_blocks_queued:
+            return 0.0
+        return self._events_queued / self._event_blocks_queued
 
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
@@ -277,9 +318,29 @@ class Recorder(threading.Thread):
         return self._get_session()
 
     def queue_task(self, task: RecorderTask | Event) -> None:
-        """Add a task to the recorder queue."""
+        """Add a task to the recorder queue.
+
+        When called from the event loop, the events which are waiting
+        to be handed off are queued first so they are processed before
+        the task.
+        """
+        if self._pending_events and self.hass.loop_thread_id == threading.get_ident():
+            self._async_hand_off_events()
         self._queue.put(task)
 
+    @callback
+    def _async_hand_off_events(self) -> None:
+        """Hand off the pending events to the recorder thread in one block."""
+        if not (pending := self._pending_events):
+            return
+        block = pending.copy()
+        pending.clear()
+        block_size = len(block)
+        self._event_blocks_queued += 1
+        self._events_queued += block_size
+        self.max_event_block_size = max(block_size, self.max_event_block_size)
+        self._queue.put_nowait(block)
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -304,7 +365,15 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        pending = self._pending_events
+        call_soon = self.hass.loop.call_soon
+        hand_off = self._async_hand_off_events
+
+        def queue_put(event: Event) -> None:
+            """Add an event to the block handed off in the next loop iteration."""
+            if not pending:
+                call_soon(hand_off)
+            pending.append(event)
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -367,6 +436,45 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    def run_in_db_workers[_T, _R](
+        self,
+        session: Session,
+        target: Callable[[Session, _T], _R],
+        items: Sequence[_T],
+    ) -> list[_R]:
+        """Run target for each item in the database workers and return the results.
+
+        Each call gets its own read-only session, so the calls only see
+        committed data. The calls are made in the calling thread with the
+        given session if there is only one item, the workers are not
+        running, or the database only has one connection.
+
+        This must be called from the recorder thread.
+        """
+        executor = self._db_executor
+        if (
+            executor is None
+            or len(items) < 2
+            or self.db_url == SQLITE_URL_PREFIX
+            or ":memory:" in self.db_url
+        ):
+            return [target(session, item) for item in items]
+
+        def _run_with_session(item: _T) -> _R:
+            """Run target with a new session."""
+            with session_scope(
+                session=self.get_session(), read_only=True
+            ) as worker_session:
+                return target(worker_session, item)
+
+        try:
+            futures = [executor.submit(_run_with_session, item) for item in items]
+        except RuntimeError:
+            # The executor was shut down, the calls are read-only
+            # so it does not matter if some of them already ran
+            return [target(session, item) for item in items]
+        return [future.result() for future in futures]
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
         if self._db_executor is None:
@@ -447,11 +555,17 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
+        self._pending_events.clear()
         while True:
             try:
-                self._queue.get_nowait()
+                item = self._queue.get_nowait()
             except queue.Empty:
                 break
+            if isinstance(item, list):
+                # The drained blocks are never processed,
+                # drop them from the backlog
+                self._event_blocks_queued -= 1
+                self._events_queued -= len(item)
         self.queue_task(StopTask())
         await self.hass.async_add_executor_job(self.join)
 
@@ -700,10 +814,13 @@ class Recorder(threading.Thread):
             self.is_running = False
             self._shutdown()
 
-    def _add_to_session(self, session: Session, obj: object) -> None:
-        """Add an object to the session."""
+    def _add_to_session(self, session: Session, obj: Base) -> None:
+        """Add an object to the session or to the pending bulk inserts."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if (bulk_inserter := self._bulk_inserter) is not None:
+            bulk_inserter.add(obj)
+        else:
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -789,6 +906,8 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        self._activate_bulk_inserts()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -831,6 +950,24 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _activate_bulk_inserts(self) -> None:
+        """Write new rows with bulk inserts once the schema is up to date.
+
+        Bulk inserts bypass the unit of work of the session, which is where
+        most of the recorder thread's time goes when many states are written.
+        Databases which can not return the ids of the inserted rows keep
+        using the unit of work.
+        """
+        assert self.engine is not None
+        if self.schema_version != SCHEMA_VERSION or not supports_dialect(
+            self.engine.dialect
+        ):
+            return
+        # Make sure no rows added to the session refer to rows
+        # which will be bulk inserted and the other way around
+        self._commit_event_session_or_retry()
+        self._bulk_inserter = BulkInserter()
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -839,7 +976,12 @@ class Recorder(threading.Thread):
         queue_ = self._queue
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
-            startup_task_or_events.append(task_or_event)
+            if isinstance(task_or_event, list):
+                startup_task_or_events.extend(task_or_event)
+                self._event_blocks_processed += 1
+                self._events_processed += len(task_or_event)
+            else:
+                startup_task_or_events.append(task_or_event)
         self._pre_process_startup_events(startup_task_or_events)
         for task in startup_task_or_events:
             self._guarded_process_one_task_or_event_or_recover(task)
@@ -850,7 +992,20 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            item = queue_.get()
+            if isinstance(item, list):
+                self._process_event_block(item)
+            else:
+                self._guarded_process_one_task_or_event_or_recover(item)
+
+    def _process_event_block(self, events: list[Event]) -> None:
+        """Process a block of events handed off by the event loop."""
+        process = self._guarded_process_one_task_or_event_or_recover
+        for event in events:
+            process(event)
+        self._event_blocks_processed += 1
+        self._events_processed += len(events)
+        self.event_latency = time.time() - events[0].time_fired_timestamp
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
@@ -1175,6 +1330,8 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        if self.history_cache is not None:
+            self._history_cache_pending.append((dbstate, shared_attrs))
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1222,6 +1379,15 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if (bulk_inserter := self._bulk_inserter) is not None:
+            try:
+                bulk_inserter.flush(session)
+            except SQLAlchemyError:
+                # Rollback so the flush starts over
+                # with a clean transaction on retry
+                session.rollback()
+                raise
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1240,6 +1406,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        if bulk_inserter is not None:
+            bulk_inserter.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1249,6 +1417,8 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        if self._history_cache_pending:
+            self._add_committed_states_to_history_cache()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1257,6 +1427,22 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _add_committed_states_to_history_cache(self) -> None:
+        """Add the states which were just committed to the history cache."""
+        assert self.history_cache is not None
+        self.history_cache.add_many(
+            (
+                dbstate.metadata_id,
+                dbstate.state,
+                dbstate.last_updated_ts,
+                dbstate.last_changed_ts,
+                shared_attrs,
+            )
+            for dbstate, shared_attrs in self._history_cache_pending
+            if dbstate.metadata_id is not None and dbstate.last_updated_ts is not None
+        )
+        self._history_cache_pending.clear()
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1264,6 +1450,8 @@ class Recorder(threading.Thread):
         finally:
             self._close_connection()
         move_away_broken_database(dburl_to_path(self.db_url))
+        if self.history_cache is not None:
+            self.history_cache.clear()
         self.recorder_runs_manager.reset()
         self._setup_recorder()
         if setup_run:
@@ -1271,12 +1459,16 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self._bulk_inserter is not None:
+            self._bulk_inserter.clear()
+        self._history_cache_pending.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.hourly_statistics_rollup.reset()
 
         if not self.event_session:
             return
@@ -1313,7 +1505,11 @@ class Recorder(threading.Thread):
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
-        if self._queue.empty() and not self._event_session_has_pending_writes:
+        if (
+            self._queue.empty()
+            and not self._pending_events
+            and not self._event_session_has_pending_writes
+        ):
             return
         event = asyncio.Event()
         self.queue_task(SynchronizeTask(event))
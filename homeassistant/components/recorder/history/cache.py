@@ -0,0 +1,277 @@
+"""In-memory cache of the recently recorded states used to answer history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Iterable
+from operator import itemgetter
+import threading
+from typing import NamedTuple
+
+# Compact the arrays of an entity once this many rows
+# have been evicted from the front of them
+_COMPACT_THRESHOLD = 512
+
+
+class HistoryCacheRow(NamedTuple):
+    """A row of the history cache.
+
+    The fields match the columns _sorted_states_to_dict
+    reads from the rows of the states queries.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _EntityHistory:
+    """Parallel arrays of the states of one metadata_id ordered by last_updated_ts.
+
+    Every state recorded for the metadata_id since the first row
+    in the arrays is in the arrays.
+    """
+
+    __slots__ = ("head", "states", "last_updated_ts", "last_changed_ts", "attributes")
+
+    def __init__(self) -> None:
+        """Initialize the arrays."""
+        self.head = 0
+        self.states: list[str | None] = []
+        self.last_updated_ts = array("d")
+        # 0.0 when last_changed is the same as last_updated
+        self.last_changed_ts = array("d")
+        self.attributes: list[str | None] = []
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.states) - self.head
+
+    def append(
+        self,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        attributes: str | None,
+    ) -> None:
+        """Append a row, keeping the rows ordered by last_updated_ts."""
+        if (
+            self
+            and (previous_attributes := self.attributes[-1]) == attributes
+            and previous_attributes is not None
+        ):
+            # Share the string with the previous row
+            attributes = previous_attributes
+        if not self or self.last_updated_ts[-1] <= last_updated_ts:
+            self.states.append(state)
+            self.last_updated_ts.append(last_updated_ts)
+            self.last_changed_ts.append(last_changed_ts or 0.0)
+            self.attributes.append(attributes)
+            return
+        idx = bisect_right(self.last_updated_ts, last_updated_ts, self.head)
+        self.states.insert(idx, state)
+        self.last_updated_ts.insert(idx, last_updated_ts)
+        self.last_changed_ts.insert(idx, last_changed_ts or 0.0)
+        self.attributes.insert(idx, attributes)
+
+    def evict_oldest(self, count: int) -> None:
+        """Evict the oldest rows."""
+        self.head += count
+        if self.head >= _COMPACT_THRESHOLD and self.head * 2 >= len(self.states):
+            head = self.head
+            del self.states[:head]
+            del self.last_updated_ts[:head]
+            del self.last_changed_ts[:head]
+            del self.attributes[:head]
+            self.head = 0
+
+
+class HistoryCache:
+    """Keep the most recently recorded states in memory.
+
+    Rows are added by the recorder thread after they are committed
+    and the oldest rows are evicted once there are more than max_rows.
+    A query can only be answered from the cache when the cache has
+    every row the database would return, otherwise None is returned
+    and the caller falls back to the database.
+    """
+
+    def __init__(self, max_rows: int) -> None:
+        """Initialize the history cache."""
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._entities: dict[int, _EntityHistory] = {}
+        # One entry per added row, in the order they were added,
+        # to evict the oldest rows first
+        self._eviction_order: deque[_EntityHistory] = deque()
+        self._num_rows = 0
+
+    @property
+    def num_rows(self) -> int:
+        """Return the number of rows in the cache."""
+        return self._num_rows
+
+    def add_many(
+        self,
+        rows: Iterable[tuple[int, str | None, float, float | None, str | None]],
+    ) -> None:
+        """Add committed rows to the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entities = self._entities
+        eviction_order = self._eviction_order
+        with self._lock:
+            for metadata_id, state, last_updated_ts, last_changed_ts, attrs in rows:
+                if (entity := entities.get(metadata_id)) is None:
+                    entity = entities[metadata_id] = _EntityHistory()
+                entity.append(state, last_updated_ts, last_changed_ts, attrs)
+                eviction_order.append(entity)
+                self._num_rows += 1
+            self._evict_over_max_rows()
+
+    def _evict_over_max_rows(self) -> None:
+        """Evict the oldest rows until there are at most max_rows.
+
+        The last row of each entity is kept, so there are only more than
+        max_rows when there are more entities than max_rows.
+        """
+        eviction_order = self._eviction_order
+        # Stop once every remaining entry is the last row of an entity
+        kept = 0
+        while self._num_rows > self.max_rows and kept < len(eviction_order):
+            entity = eviction_order.popleft()
+            if len(entity) > 1:
+                entity.evict_oldest(1)
+                self._num_rows -= 1
+                kept = 0
+            else:
+                # Always keep the last row of an entity so the state
+                # at the start of a window can be found for entities
+                # which do not change often
+                eviction_order.append(entity)
+                kept += 1
+
+    def evict_before(self, timestamp: float) -> None:
+        """Evict the rows which were last updated before timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            for metadata_id, entity in list(self._entities.items()):
+                idx = bisect_left(entity.last_updated_ts, timestamp, entity.head)
+                if evicted := idx - entity.head:
+                    entity.evict_oldest(evicted)
+                    self._num_rows -= evicted
+                if not entity:
+                    del self._entities[metadata_id]
+            # The evicted rows are not necessarily the oldest entries
+            # of the eviction order, rebuild it from the remaining rows
+            self._eviction_order = deque(
+                entity
+                for _, entity in sorted(
+                    (
+                        (last_updated_ts, entity)
+                        for entity in self._entities.values()
+                        for last_updated_ts in entity.last_updated_ts[entity.head :]
+                    ),
+                    key=itemgetter(0),
+                )
+            )
+
+    def clear(self) -> None:
+        """Clear the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with self._lock:
+            self._entities.clear()
+            self._eviction_order.clear()
+            self._num_rows = 0
+
+    def get_significant_states_rows(
+        self,
+        metadata_ids: list[int],
+        metadata_ids_in_significant_domains: list[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        no_attributes: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+    ) -> list[HistoryCacheRow] | None:
+        """Return the rows the significant states query would return.
+
+        Returns None if the cache does not have all the rows.
+        """
+        include_last_changed = not significant_changes_only
+        significant_domain_ids = set(metadata_ids_in_significant_domains)
+        # The query for the start time state of multiple entities
+        # only looks at states since the start of the recorder run
+        min_start_state_ts = run_start_ts if len(metadata_ids) > 1 else None
+        rows: list[HistoryCacheRow] = []
+        with self._lock:
+            for metadata_id in sorted(metadata_ids):
+                if (entity := self._entities.get(metadata_id)) is None:
+                    return None
+                head = entity.head
+                last_updated = entity.last_updated_ts
+                if not entity or last_updated[head] >= start_time_ts:
+                    return None
+                # The database query excludes rows updated
+                # exactly at the start time from both parts
+                start_idx = bisect_right(last_updated, start_time_ts, head)
+                end_idx = (
+                    bisect_left(last_updated, end_time_ts, start_idx)
+                    if end_time_ts
+                    else len(last_updated)
+                )
+                states = entity.states
+                last_changed = entity.last_changed_ts
+                attributes = entity.attributes
+                if include_start_time_state and (
+                    (state_idx := bisect_left(last_updated, start_time_ts, head) - 1)
+                    >= head
+                    and (
+                        min_start_state_ts is None
+                        or last_updated[state_idx] >= min_start_state_ts
+                    )
+                ):
+                    rows.append(
+                        HistoryCacheRow(
+                            metadata_id,
+                            states[state_idx],
+                            0,
+                            0 if include_last_changed else None,
+                            None if no_attributes else attributes[state_idx],
+                        )
+                    )
+                all_significant = (
+                    not significant_changes_only
+                    or metadata_id in significant_domain_ids
+                )
+                for idx in range(start_idx, end_idx):
+                    last_updated_ts = last_updated[idx]
+                    last_changed_ts = last_changed[idx]
+                    if not all_significant and last_changed_ts not in (
+                        0.0,
+                        last_updated_ts,
+                    ):
+                        continue
+                    rows.append(
+                        HistoryCacheRow(
+                            metadata_id,
+                            states[idx],
+                            last_updated_ts,
+                            (last_changed_ts or None) if include_last_changed else None,
+                            None if no_attributes else attributes[idx],
+                        )
+                    )
+        return rows
@@ -253,6 +253,27 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    if (history_cache := instance.history_cache) is not None and (
+        cached_rows := history_cache.get_significant_states_rows(
+            metadata_ids,
+            metadata_ids_in_significant_domains,
+            start_time_ts,
+            end_time_ts,
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+            run_start_ts,
+        )
+    ) is not None:
+        return _sorted_states_to_dict(
+            cached_rows,  # type: ignore[arg-type]
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+        )
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
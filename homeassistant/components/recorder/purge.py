@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -52,6 +53,39 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# A purge cycle stops selecting more batches once it ran for this many
+# seconds, so the recorder can write the events which queued up meanwhile
+PURGE_CYCLE_TIME_BUDGET = 5.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge which takes multiple purge cycles."""
+
+    purge_before: datetime
+    started: float = field(default_factory=time.monotonic)
+    cycles: int = 0
+    states: int = 0
+    events: int = 0
+    short_term_statistics: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of purged rows per second since the purge started."""
+        if not (elapsed := time.monotonic() - self.started):
+            return 0.0
+        return (self.states + self.events + self.short_term_statistics) / elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary version of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "cycles": self.cycles,
+            "states": self.states,
+            "events": self.events,
+            "short_term_statistics": self.short_term_statistics,
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
 
 
 @retryable_database_job("purge")
@@ -66,11 +100,21 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    A purge cycle stops selecting more states and events once it took
+    PURGE_CYCLE_TIME_BUDGET seconds. The progress of the purge is kept
+    on the instance until the purge is done.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if (
+        progress := instance.purge_progress
+    ) is None or progress.purge_before != purge_before:
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    progress.cycles += 1
+    deadline = time.monotonic() + PURGE_CYCLE_TIME_BUDGET
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -87,10 +131,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -104,6 +148,7 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            progress.short_term_statistics += len(short_term_statistics)
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -123,6 +168,8 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    _LOGGER.debug("Purge before %s finished: %s", purge_before, progress.as_dict())
+    instance.purge_progress = None
     if repack:
         repack_database(instance)
     return True
@@ -178,6 +225,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -185,6 +233,8 @@ def _purge_states_and_attributes_ids(
     """
     database_engine = instance.database_engine
     assert database_engine is not None
+    progress = instance.purge_progress
+    assert progress is not None
     has_remaining_state_ids_to_purge = True
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
@@ -200,7 +250,10 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.states += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,11 +268,14 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
     Returns true if there are more states to purge.
     """
+    progress = instance.purge_progress
+    assert progress is not None
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
     # we purge enough event_ids to try to generate a full
@@ -235,7 +291,10 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.events += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -192,6 +192,104 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+_SHORT_TERM_PERIODS_PER_HOUR = Statistics.duration // StatisticsShortTerm.duration
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsRollup:
+    """Roll up the 5-minute statistics of the current hour as they are compiled.
+
+    When all 5-minute periods of an hour were rolled up, the hourly
+    statistics are summarized from the rollup instead of querying the
+    5-minute statistics table. The rollup is reset when 5-minute
+    statistics are changed in other ways, in which case the hourly
+    statistics are compiled from the table.
+
+    This is only used from the recorder thread.
+    """
+
+    _hour_start_ts: float | None = None
+    # metadata_id -> start_ts of the 5-minute period -> statistics
+    _stats: dict[int, dict[float, StatisticData]] = dataclasses.field(
+        default_factory=dict
+    )
+    _period_start_tss: set[float] = dataclasses.field(default_factory=set)
+
+    def reset(self) -> None:
+        """Forget the rolled up statistics."""
+        self._hour_start_ts = None
+        self._stats.clear()
+        self._period_start_tss.clear()
+
+    def add_period(
+        self, start: datetime, period_stats: Iterable[tuple[int, StatisticData]]
+    ) -> None:
+        """Roll up the statistics compiled for a 5-minute period."""
+        if (hour_start_ts := start.replace(minute=0).timestamp()) != (
+            self._hour_start_ts
+        ):
+            self.reset()
+            self._hour_start_ts = hour_start_ts
+        start_ts = start.timestamp()
+        self._period_start_tss.add(start_ts)
+        stats = self._stats
+        for metadata_id, stat in period_stats:
+            if (metadata_stats := stats.get(metadata_id)) is None:
+                metadata_stats = stats[metadata_id] = {}
+            metadata_stats[start_ts] = stat
+
+    def get_summary(
+        self, start_time: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics of the hour starting at start_time.
+
+        Returns None if not all 5-minute periods of the hour were rolled up.
+        """
+        start_time_ts = start_time.timestamp()
+        if (
+            self._hour_start_ts != start_time_ts
+            or len(self._period_start_tss) != _SHORT_TERM_PERIODS_PER_HOUR
+        ):
+            return None
+        summary: dict[int, StatisticDataTimestamp] = {}
+        for metadata_id, metadata_stats in self._stats.items():
+            # Match the aggregates of the database, which ignore NULL
+            means = [
+                mean_
+                for stat in metadata_stats.values()
+                if (mean_ := stat.get("mean")) is not None
+            ]
+            mins = [
+                min_
+                for stat in metadata_stats.values()
+                if (min_ := stat.get("min")) is not None
+            ]
+            maxes = [
+                max_
+                for stat in metadata_stats.values()
+                if (max_ := stat.get("max")) is not None
+            ]
+            last_stat = metadata_stats[max(metadata_stats)]
+            summary_item: StatisticDataTimestamp = {
+                "start_ts": start_time_ts,
+                "last_reset_ts": datetime_to_timestamp_or_none(
+                    last_stat.get("last_reset")
+                ),
+            }
+            if means:
+                summary_item["mean"] = sum(means) / len(means)
+            if mins:
+                summary_item["min"] = min(mins)
+            if maxes:
+                summary_item["max"] = max(maxes)
+            if (state := last_stat.get("state")) is not None:
+                summary_item["state"] = state
+            if (sum_ := last_stat.get("sum")) is not None:
+                summary_item["sum"] = sum_
+            summary[metadata_id] = summary_item
+        return summary
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -388,14 +486,35 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If all 5-minute statistics of the hour were rolled up while they
+    were compiled, they are summarized from the rollup instead.
     """
     start_time = start.replace(minute=0)
+    if (summary := instance.hourly_statistics_rollup.get_summary(start_time)) is None:
+        summary = _compile_hourly_statistics_summary(session, start_time)
+    else:
+        _LOGGER.debug("Summarized hourly statistics for %s from rollup", start_time)
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _compile_hourly_statistics_summary(
+    session: Session, start_time: datetime
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics of the hour starting at start_time."""
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
@@ -438,11 +557,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -571,6 +686,7 @@ def _compile_statistics(
 
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
+    rolled_up_stats: list[tuple[int, StatisticData]] = []
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -586,10 +702,12 @@ def _compile_statistics(
             stats["stat"],
         ):
             new_short_term_stats.append(new_stat)
+            rolled_up_stats.append((metadata_id, stats["stat"]))
+    instance.hourly_statistics_rollup.add_period(start, rolled_up_stats)
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(instance, session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -734,6 +852,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    instance.hourly_statistics_rollup.reset()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -2364,6 +2483,8 @@ def _import_statistics_with_session(
     if table != StatisticsShortTerm:
         return True
 
+    instance.hourly_statistics_rollup.reset()
+
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2475,6 +2596,7 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        instance.hourly_statistics_rollup.reset()
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2552,6 +2674,7 @@ def change_statistics_unit(
             Statistics,
             StatisticsShortTerm,
         )
+        instance.hourly_statistics_rollup.reset()
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from collections.abc import Collection, Iterable
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +40,27 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The last serialized attributes of each entity, the state machine
+        # reuses the attributes object of the previous state when the
+        # attributes did not change so it can be reused without
+        # serializing the attributes again
+        self._last_serialized: dict[
+            str, tuple[ReadOnlyDict[str, Any], StateInfo | None, bytes]
+        ] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        if (new_state := event.data["new_state"]) is None:
+            self._last_serialized.pop(event.data["entity_id"], None)
+        elif (
+            last_serialized := self._last_serialized.get(new_state.entity_id)
+        ) is not None and (
+            last_serialized[0] is new_state.attributes
+            and last_serialized[1] is new_state.state_info
+        ):
+            return last_serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +70,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if new_state is not None:
+            self._last_serialized[new_state.entity_id] = (
+                new_state.attributes,
+                new_state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -111,6 +111,11 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        if (history_cache := instance.history_cache) is not None:
+            if self.apply_filter:
+                history_cache.clear()
+            else:
+                history_cache.evict_before(self.purge_before.timestamp())
         if purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
         ):
@@ -136,6 +141,8 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        if instance.history_cache is not None:
+            instance.history_cache.clear()
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
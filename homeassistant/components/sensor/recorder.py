@@ -72,6 +72,9 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# The number of sensors of which the history is fetched
+# in one go when statistics are compiled
+COMPILE_STATISTICS_CHUNK_SIZE = 500
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -388,17 +391,15 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _get_entities_with_float_states(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+) -> dict[str, list[tuple[float, State]]]:
+    """Get the float states of sensors between start and end."""
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -438,6 +439,41 @@ def compile_statistics(  # noqa: C901
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
             continue
         entities_with_float_states[entity_id] = float_states
+    return entities_with_float_states
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+
+    def _get_float_states(
+        session: Session, chunk: list[State]
+    ) -> dict[str, list[tuple[float, State]]]:
+        """Get the float states between start and end of a chunk of sensors."""
+        return _get_entities_with_float_states(
+            hass, session, start, end, chunk, wanted_statistics
+        )
+
+    # The history of the sensors is fetched and converted
+    # in chunks spread over the database workers
+    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    for chunk_float_states in get_instance(hass).run_in_db_workers(
+        session,
+        _get_float_states,
+        [
+            sensor_states[idx : idx + COMPILE_STATISTICS_CHUNK_SIZE]
+            for idx in range(0, len(sensor_states), COMPILE_STATISTICS_CHUNK_SIZE)
+        ],
+    ):
+        entities_with_float_states.update(chunk_float_states)
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
@@ -0,0 +1,153 @@
+"""Running aggregates of the samples kept by a statistics sensor."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class RollingStatistics:
+    """Keep the samples of a statistics sensor and their running aggregates.
+
+    Samples are added at the end and removed from the start, and every
+    aggregate is updated with the sample that was added or removed instead
+    of iterating the whole buffer. The sums are recalculated from the
+    samples once as many samples were removed as are in the buffer, so
+    the rounding errors of the running sums cannot build up.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the rolling statistics."""
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque(maxlen=max_size)
+        self.ages: deque[datetime] = deque(maxlen=max_size)
+        self.sorted_states: list[float | bool] = []
+        self._removed = 0
+        self.sum: float = 0
+        self.count_on: int = 0
+        self.sin_sum: float = 0.0
+        self.cos_sum: float = 0.0
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+        # The area under the samples connected with lines and with steps
+        self.area_linear: float = 0.0
+        self.area_step: float = 0.0
+        # Welford's mean and sum of squared differences from the mean
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.sum = 0
+        self.count_on = 0
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+        self.sum_differences = 0
+        self.sum_differences_nonnegative = 0
+        self.area_linear = 0.0
+        self.area_step = 0.0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest sample if the buffer is full.
+
+        Raises ValueError for infinite and NaN samples, which would
+        corrupt the running sums and the sorted samples.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Sample is not finite: {value}")
+        if self.max_size is not None and len(self.states) >= self.max_size:
+            self.popleft()
+        if self.states:
+            self._add_segment(self.states[-1], self.ages[-1], value, age)
+        self.states.append(value)
+        self.ages.append(age)
+        insort(self.sorted_states, value)
+        self._add_value(value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        del self.sorted_states[bisect_left(self.sorted_states, value)]
+        self._removed += 1
+        if self._removed >= len(self.states):
+            self._recalculate()
+            return
+        self._add_segment(value, age, self.states[0], self.ages[0], -1)
+        self._add_value(value, -1)
+
+    def _recalculate(self) -> None:
+        """Recalculate the running sums from the samples."""
+        self._removed = 0
+        self._reset_sums()
+        previous: tuple[float | bool, datetime] | None = None
+        for value, age in zip(self.states, self.ages, strict=True):
+            if previous is not None:
+                self._add_segment(*previous, value, age)
+            self._add_value(value)
+            previous = (value, age)
+
+    def _add_value(self, value: float | bool, sign: int = 1) -> None:
+        """Add or remove a sample from the running sums."""
+        self.sum += sign * value
+        self.count_on += sign * (value is True)
+        radians = math.radians(value)
+        self.sin_sum += sign * math.sin(radians)
+        self.cos_sum += sign * math.cos(radians)
+        self._count += sign
+        if not self._count:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean += sign * delta / self._count
+        self._m2 = max(self._m2 + sign * delta * (value - self._mean), 0.0)
+
+    def _add_segment(
+        self,
+        first_value: float | bool,
+        first_age: datetime,
+        second_value: float | bool,
+        second_age: datetime,
+        sign: int = 1,
+    ) -> None:
+        """Add or remove the segment between two consecutive samples."""
+        seconds = (second_age - first_age).total_seconds()
+        self.area_linear += sign * 0.5 * (second_value + first_value) * seconds
+        self.area_step += sign * first_value * seconds
+        self.sum_differences += sign * abs(second_value - first_value)
+        self.sum_differences_nonnegative += sign * (
+            second_value - first_value if second_value >= first_value else second_value
+        )
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return self._m2 / (len(self.states) - 1)
+
+    @property
+    def median(self) -> float:
+        """Return the median, requires at least one sample."""
+        data = self.sorted_states
+        count = len(data)
+        middle = count // 2
+        if count % 2 == 1:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, requires at least two samples.
+
+        The same as statistics.quantiles with n=100 and the exclusive method.
+        """
+        data = self.sorted_states
+        count = len(data)
+        idx = percentile * (count + 1) // 100
+        idx = min(max(idx, 1), count - 1)
+        delta = percentile * (count + 1) - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
@@ -8,7 +8,6 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -56,6 +55,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .rolling import RollingStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -362,8 +362,9 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._rolling = RollingStatistics(self._samples_max_buffer_size)
+        self.states: deque[float | bool] = self._rolling.states
+        self.ages: deque[datetime] = self._rolling.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
@@ -417,10 +418,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._rolling.append(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -544,8 +545,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._rolling.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -699,27 +699,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._rolling.area_linear / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._rolling.area_step / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -757,12 +744,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self.ages[self.states.index(self._rolling.sorted_states[-1])]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self.ages[self.states.index(self._rolling.sorted_states[0])]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -777,24 +764,26 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            sorted_states = self._rolling.sorted_states
+            return sorted_states[-1] - sorted_states[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._rolling.sum / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            rolling = self._rolling
+            return (
+                math.degrees(math.atan2(rolling.sin_sum, rolling.cos_sum)) + 360
+            ) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._rolling.median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -804,34 +793,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._rolling.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self._rolling.variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._rolling.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._rolling.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return self._rolling.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -839,29 +821,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._rolling.sorted_states[-1]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._rolling.sorted_states[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._rolling.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            return 100 / age_range_seconds * self._rolling.area_step
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -871,10 +849,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._rolling.count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._rolling.count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -884,5 +862,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._rolling.count_on
         return None
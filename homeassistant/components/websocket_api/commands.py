@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import lru_cache, partial
 import json
 import logging
+import time
 from typing import Any, cast
 
 import voluptuous as vol
@@ -19,6 +23,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -34,7 +39,7 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import config_validation as cv, entity, singleton, template
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
@@ -51,11 +56,13 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -63,6 +70,11 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+# The number of recent state changes kept to resume subscriptions
+REPLAY_BUFFER_SIZE = 4096
+ENTITIES_SUBSCRIPTION_HUB: HassKey[_EntitiesSubscriptionHub] = HassKey(
+    "websocket_api_entities_subscription_hub"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +94,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -326,6 +339,16 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    user = connection.user
+    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+        try:
+            json_states = hass.states.async_all_as_dict_json()
+        except (ValueError, TypeError):
+            pass
+        else:
+            connection.send_message(construct_result_message(msg["id"], json_states))
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -363,28 +386,242 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
+@dataclass(slots=True, eq=False)
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | bytes | dict[str, Any]], None]
+    user: User
+    message_id_as_bytes: bytes
+    rate_limiter: _EntitiesRateLimiter | None = None
+    resumable: bool = False
+
+
+class _EntitiesRateLimiter:
+    """Limit how often the changes of an entity are sent to a subscription.
+
+    The first change of an entity is sent right away and starts a window
+    of rate_limit seconds. The changes during the window are merged into
+    one diff, from the state the client last received to the newest state,
+    which is sent when the window ends and starts the next window.
+    """
+
+    __slots__ = ("_loop", "_rate_limit", "_windows", "_pending", "_timers")
+
+    def __init__(self, hass: HomeAssistant, rate_limit: float) -> None:
+        """Initialize the rate limiter."""
+        self._loop = hass.loop
+        self._rate_limit = rate_limit
+        # The time the window of an entity ends
+        self._windows: dict[str, float] = {}
+        # The state the client has and the newest state of held back changes
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    @callback
+    def async_add(
+        self,
+        subscription: _EntitiesSubscription,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Send or hold back a state change."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if pending := self._pending.get(entity_id):
+            self._pending[entity_id] = (pending[0], data["new_state"])
+            return
+        now = self._loop.time()
+        if (window_end := self._windows.get(entity_id, 0)) <= now:
+            self._windows[entity_id] = now + self._rate_limit
+            subscription.send_message(
+                messages.cached_state_diff_message(
+                    subscription.message_id_as_bytes, event
+                )
+            )
+            return
+        self._pending[entity_id] = (data["old_state"], data["new_state"])
+        self._timers[entity_id] = self._loop.call_at(
+            window_end, self._async_send_pending, subscription, entity_id
+        )
+
+    @callback
+    def _async_send_pending(
+        self, subscription: _EntitiesSubscription, entity_id: str
+    ) -> None:
+        """Send the merged diff of the held back changes of an entity."""
+        del self._timers[entity_id]
+        old_state, new_state = self._pending.pop(entity_id)
+        if old_state is None and new_state is None:
+            # Added and removed again during the window
+            return
+        self._windows[entity_id] = self._loop.time() + self._rate_limit
+        event = Event(
+            EVENT_STATE_CHANGED,
+            EventStateChangedData(
+                entity_id=entity_id, old_state=old_state, new_state=new_state
+            ),
+        )
+        if message := messages.state_diff_message(
+            subscription.message_id_as_bytes, event
+        ):
+            subscription.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the held back changes."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+
+class _EntitiesSubscriptionHub:
+    """Forward state changes to the subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all subscriptions and
+    the subscriptions are indexed by entity_id, so a state change only
+    runs the subscriptions interested in the entity.
+
+    Every state change gets a sequence number. Once a resumable
+    subscription was made, the most recent state changes are kept in
+    a replay buffer so a client which reconnects can resume from the
+    last sequence it received. The sequence starts at the current time
+    in microseconds so the sequences of a previous run are never taken
+    for sequences of this run.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._all_entities: set[_EntitiesSubscription] = set()
+        self._by_entity_id: dict[str, set[_EntitiesSubscription]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self.seq = time.time_ns() // 1000
+        self._replay: deque[tuple[int, Event[EventStateChangedData]]] | None = None
+        # The first sequence which is in the replay buffer or was evicted
+        self._replay_start_seq = 0
+
+    @callback
+    def async_enable_replay(self) -> None:
+        """Start keeping the recent state changes for resumable subscriptions.
+
+        The replay buffer is kept, and the state changed listener with it,
+        for as long as the hub exists.
+        """
+        if self._replay is None:
+            self._replay = deque(maxlen=REPLAY_BUFFER_SIZE)
+            self._replay_start_seq = self.seq + 1
+            self._async_ensure_listener()
+
+    @callback
+    def async_get_replay(
+        self, last_seq: int
+    ) -> list[tuple[int, Event[EventStateChangedData]]] | None:
+        """Return the state changes after last_seq.
+
+        Returns None if some of the state changes are not in the replay buffer.
+        """
+        if (replay := self._replay) is None or not (
+            self._replay_start_seq - 1 <= last_seq <= self.seq
+        ):
+            return None
+        if replay and replay[0][0] > last_seq + 1:
+            return None
+        return [item for item in replay if item[0] > last_seq]
+
+    @callback
+    def _async_ensure_listener(self) -> None:
+        """Listen to state changes if not listening yet."""
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: set[str], subscription: _EntitiesSubscription
+    ) -> CALLBACK_TYPE:
+        """Add a subscription to the state changes of entity_ids or all entities."""
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                by_entity_id.setdefault(entity_id, set()).add(subscription)
+        else:
+            self._all_entities.add(subscription)
+        self._async_ensure_listener()
+        return partial(self._async_unsubscribe, entity_ids, subscription)
+
+    @callback
+    def _async_unsubscribe(
+        self, entity_ids: set[str], subscription: _EntitiesSubscription
+    ) -> None:
+        """Remove a subscription."""
+        if entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                subscriptions = by_entity_id[entity_id]
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del by_entity_id[entity_id]
+        else:
+            self._all_entities.discard(subscription)
+        if subscription.rate_limiter is not None:
+            subscription.rate_limiter.async_cancel()
+        if (
+            not self._all_entities
+            and not self._by_entity_id
+            and self._replay is None
+            and self._unsub
+        ):
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward entity state changed events to websocket."""
+        self.seq += 1
+        if self._replay is not None:
+            self._replay.append((self.seq, event))
+        entity_id = event.data["entity_id"]
+        entity_subscriptions = self._by_entity_id.get(entity_id)
+        if not self._all_entities and not entity_subscriptions:
+            return
+        # Copy the subscriptions as sending a message may
+        # close the connection which removes its subscriptions
+        subscriptions = [*self._all_entities, *(entity_subscriptions or ())]
+        for subscription in subscriptions:
+            # We have to lookup the permissions again because the user might have
+            # changed since the subscription was created.
+            if not _can_read_entity(subscription.user, entity_id):
+                continue
+            if subscription.rate_limiter is not None:
+                subscription.rate_limiter.async_add(subscription, event)
+                continue
+            subscription.send_message(
+                messages.cached_state_diff_message(
+                    subscription.message_id_as_bytes,
+                    event,
+                    self.seq if subscription.resumable else None,
+                )
+            )
+
+
+def _can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if the user may read the state of an entity."""
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+@singleton.singleton(ENTITIES_SUBSCRIPTION_HUB)
+def _entities_subscription_hub(hass: HomeAssistant) -> _EntitiesSubscriptionHub:
+    """Return the subscribe_entities subscription hub."""
+    return _EntitiesSubscriptionHub(hass)
 
 
 @callback
@@ -392,29 +629,68 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Exclusive("rate_limit", "rate_limit"): cv.positive_float,
+        vol.Exclusive("resumable", "rate_limit"): cv.boolean,
+        vol.Exclusive("resume_from", "rate_limit"): cv.positive_int,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    A resumable subscription adds the sequence of the state changes to
+    the messages. Subscribing with resume_from, the last sequence the
+    client received, only sends the state changes the client missed if
+    they are all still in the replay buffer, otherwise all states are
+    sent as usual. The result tells the client which of the two it gets.
+    """
     entity_ids = set(msg.get("entity_ids", []))
+    hub = _entities_subscription_hub(hass)
+    resume_from: int | None = msg.get("resume_from")
+    resumable = resume_from is not None or msg.get("resumable", False)
+    replay: list[tuple[int, Event[EventStateChangedData]]] | None = None
+    if resumable:
+        hub.async_enable_replay()
+        if resume_from is not None:
+            replay = hub.async_get_replay(resume_from)
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    connection.subscriptions[msg["id"]] = hub.async_subscribe(
+        entity_ids,
+        _EntitiesSubscription(
             connection.send_message,
-            entity_ids,
             connection.user,
             message_id_as_bytes,
+            _EntitiesRateLimiter(hass, rate_limit)
+            if (rate_limit := msg.get("rate_limit"))
+            else None,
+            resumable,
         ),
     )
-    connection.send_result(msg["id"])
+    if not resumable:
+        connection.send_result(msg["id"])
+    else:
+        connection.send_result(msg["id"], {"resumed": replay is not None})
+
+    if replay is not None:
+        user = connection.user
+        for event_seq, event in replay:
+            entity_id = event.data["entity_id"]
+            if (not entity_ids or entity_id in entity_ids) and _can_read_entity(
+                user, entity_id
+            ):
+                connection.send_message(
+                    messages.cached_state_diff_message(
+                        message_id_as_bytes, event, event_seq
+                    )
+                )
+        return
+
+    states = _async_get_allowed_states(hass, connection)
+    seq = hub.seq if resumable else None
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
@@ -428,7 +704,9 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(
+            connection, msg["id"], serialized_states, seq
+        )
         return
 
     serialized_states = []
@@ -443,11 +721,14 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(connection, msg["id"], serialized_states, seq)
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+    connection: ActiveConnection,
+    msg_id: int,
+    serialized_states: list[bytes],
+    seq: int | None = None,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -455,6 +736,7 @@ def _send_handle_entities_init_response(
             (
                 b'{"id":',
                 str(msg_id).encode(),
+                b"" if seq is None else b',"seq":' + str(seq).encode(),
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
                 b"}}}",
@@ -547,6 +829,21 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in async_get_import_timings(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -648,6 +945,7 @@ async def handle_render_template(
             _template_listener,
             strict=msg["strict"],
             log_fn=log_fn,
+            batch_renders=True,
         )
     except TemplateError as ex:
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
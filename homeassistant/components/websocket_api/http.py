@@ -89,7 +89,10 @@ class WebSocketHandler:
         self._hass = hass
         self._loop = hass.loop
         self._request: web.Request = request
-        self._wsock = web.WebSocketResponse(heartbeat=55)
+        # permessage-deflate is negotiated with clients which offer it.
+        # aiohttp keeps the compression context for the whole connection
+        # and compresses frames larger than 5KiB in the executor.
+        self._wsock = web.WebSocketResponse(heartbeat=55, compress=True)
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._closing: bool = False
@@ -142,7 +142,9 @@ def _partial_cached_event_message(event: Event) -> bytes:
 
 
 def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    seq: int | None = None,
 ) -> bytes:
     """Return an event message.
 
@@ -151,10 +153,13 @@ def cached_state_diff_message(
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+
+    The sequence of the state change is added for resumable subscriptions.
     """
     return b"".join(
         (
             _partial_cached_state_diff_message(event)[:-1],
+            b"" if seq is None else b',"seq":' + str(seq).encode(),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -162,6 +167,22 @@ def cached_state_diff_message(
     )
 
 
+def state_diff_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+) -> bytes | None:
+    """Return an event message of a state diff which is sent once.
+
+    Returns None if the diff can not be serialized.
+    """
+    return _message_to_json_bytes_or_none(
+        {
+            "type": "event",
+            "event": _state_diff_event(event),
+            "id": int(message_id_as_bytes),
+        }
+    )
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -221,9 +242,11 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
-        new_attributes := new_state.attributes
-    ):
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    # The state machine reuses the attributes of the old state
+    # when they did not change
+    if old_attributes is not new_attributes and old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
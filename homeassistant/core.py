@@ -1995,12 +1995,16 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    and the JSON of the states of each domain, which is
+    dropped when a state of the domain is added or removed.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._domain_json: dict[str, bytes] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2010,11 +2014,13 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        self._domain_json.pop(entry.domain, None)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        self._domain_json.pop(entry.domain, None)
         super().__delitem__(key)
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
@@ -2031,6 +2037,24 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def domains_as_dict_json(self) -> list[bytes]:
+        """Get the JSON of the states of each domain.
+
+        Each item is the comma separated as_dict_json of the states
+        of a domain. Only the domains which changed since the last
+        call are serialized again.
+        """
+        domain_json = self._domain_json
+        result: list[bytes] = []
+        for domain, domain_states in self._domain_index.items():
+            if (domain_json_bytes := domain_json.get(domain)) is None:
+                domain_json_bytes = domain_json[domain] = b",".join(
+                    state.as_dict_json for state in domain_states.values()
+                )
+            if domain_json_bytes:
+                result.append(domain_json_bytes)
+        return result
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
@@ -2116,6 +2140,20 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_as_dict_json(self) -> bytes:
+        """Return the JSON array of all states.
+
+        The states are grouped by domain and the JSON of a domain is
+        reused until a state of the domain changes, so frequent requests
+        for all states only serialize the domains which changed.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+
+        This method must be run in the event loop.
+        """
+        return b"".join((b"[", b",".join(self._states.domains_as_dict_json()), b"]"))
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2285,7 +2323,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
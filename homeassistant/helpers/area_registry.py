@@ -22,7 +22,7 @@ from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryItems,
     normalize_name,
 )
-from .registry import BaseRegistry, RegistryIndexType
+from .registry import BaseRegistry, RegistryIndexType, async_get_generation
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
@@ -361,6 +361,7 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
         data = await self._store.async_load()
 
         areas = AreaRegistryItems()
+        areas.generation = async_get_generation(self.hass)
 
         if data is not None:
             for area in data["areas"]:
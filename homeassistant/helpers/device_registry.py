@@ -40,7 +40,12 @@ from .deprecation import (
 )
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistry,
+    BaseRegistryItems,
+    RegistryIndexType,
+    async_get_generation,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -648,6 +653,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -1166,6 +1172,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
 
         devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
+        devices.generation = async_get_generation(self.hass)
 
         if data is not None:
             for device in data["devices"]:
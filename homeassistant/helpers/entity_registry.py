@@ -60,7 +60,12 @@ from .device_registry import (
     EventDeviceRegistryUpdatedData,
 )
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistry,
+    BaseRegistryItems,
+    RegistryIndexType,
+    async_get_generation,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -704,6 +709,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1251,6 +1257,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
+        entities.generation = async_get_generation(self.hass)
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
 
         if data is not None:
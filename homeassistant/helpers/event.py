@@ -76,6 +76,10 @@ _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
 
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -89,6 +93,10 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# Re-renders of tracked templates triggered by state changes run for at
+# most this many seconds before yielding to the event loop
+TEMPLATE_RENDER_SLICE_TIME = 0.05
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
@@ -962,6 +970,78 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Batch the re-renders of tracked templates triggered by state changes.
+
+    The state changes are collected per tracker while the event loop
+    dispatches them, keeping only the last state change of each entity,
+    and the trackers are refreshed by a task which yields to the event
+    loop every TEMPLATE_RENDER_SLICE_TIME seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._pending: dict[
+            TrackTemplateResultInfo, dict[str, Event[EventStateChangedData]]
+        ] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_schedule(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Schedule a refresh of a tracker for a state change."""
+        if (events := self._pending.get(tracker)) is None:
+            events = self._pending[tracker] = {}
+        entity_id = event.data["entity_id"]
+        events.pop(entity_id, None)
+        events[entity_id] = event
+        if self._task is None:
+            self._task = self.hass.async_create_task_internal(
+                self._async_refresh_pending(),
+                "template render scheduler",
+                eager_start=False,
+            )
+
+    @callback
+    def async_cancel(self, tracker: TrackTemplateResultInfo) -> None:
+        """Cancel the pending refreshes of a tracker."""
+        self._pending.pop(tracker, None)
+
+    async def _async_refresh_pending(self) -> None:
+        """Refresh the pending trackers in time slices."""
+        pending = self._pending
+        slice_end = time.monotonic() + TEMPLATE_RENDER_SLICE_TIME
+        try:
+            while pending:
+                tracker, events = next(iter(pending.items()))
+                event = events.pop(next(iter(events)))
+                if not events:
+                    del pending[tracker]
+                try:
+                    tracker.async_refresh_from_event(event)
+                except Exception:
+                    _LOGGER.exception("Error while refreshing %s", tracker)
+                if pending and time.monotonic() >= slice_end:
+                    await asyncio.sleep(0)
+                    slice_end = time.monotonic() + TEMPLATE_RENDER_SLICE_TIME
+        finally:
+            self._task = None
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -971,6 +1051,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        batch_renders: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -978,6 +1059,7 @@ class TrackTemplateResultInfo:
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
+        self._batch_renders = batch_renders
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
@@ -1038,8 +1120,11 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
+        refresh: Callable[[Event[EventStateChangedData]], None] = self._refresh
+        if self._batch_renders:
+            refresh = self._async_schedule_refresh
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass, _render_infos_to_track_states(self._info.values()), refresh
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1096,6 +1181,8 @@ class TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        if self._batch_renders:
+            _async_get_template_render_scheduler(self.hass).async_cancel(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1105,6 +1192,16 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_from_event(self, event: Event[EventStateChangedData]) -> None:
+        """Recalculate the templates affected by a state change."""
+        self._refresh(event)
+
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh of the templates for a state change."""
+        _async_get_template_render_scheduler(self.hass).async_schedule(self, event)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1320,6 +1417,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    batch_renders: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1351,13 +1449,20 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    batch_renders
+        When set to True, the re-renders triggered by state changes are
+        batched and time-sliced, and only the last state change of each
+        entity is rendered. Only use it when the intermediate results are
+        not observed, for example to display the result.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, batch_renders
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
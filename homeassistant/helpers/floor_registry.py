@@ -19,7 +19,7 @@ from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryItems,
     normalize_name,
 )
-from .registry import BaseRegistry
+from .registry import BaseRegistry, async_get_generation
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
@@ -240,6 +240,7 @@ class FloorRegistry(BaseRegistry[FloorRegistryStoreData]):
         """Load the floor registry."""
         data = await self._store.async_load()
         floors = NormalizedNameBaseRegistryItems[FloorEntry]()
+        floors.generation = async_get_generation(self.hass)
 
         if data is not None:
             for floor in data["floors"]:
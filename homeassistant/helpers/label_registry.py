@@ -19,7 +19,7 @@ from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryItems,
     normalize_name,
 )
-from .registry import BaseRegistry
+from .registry import BaseRegistry, async_get_generation
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
@@ -241,6 +241,7 @@ class LabelRegistry(BaseRegistry[LabelRegistryStoreData]):
         """Load the label registry."""
         data = await self._store.async_load()
         labels = NormalizedNameBaseRegistryItems[LabelEntry]()
+        labels.generation = async_get_generation(self.hass)
 
         if data is not None:
             for label in data["labels"]:
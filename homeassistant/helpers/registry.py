@@ -5,24 +5,51 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
 from collections.abc import Mapping, Sequence, ValuesView
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
 
 if TYPE_CHECKING:
     from .storage import Store
 
+DATA_GENERATION: HassKey[RegistryGeneration] = HassKey("registry_generation")
+
 SAVE_DELAY = 10
 SAVE_DELAY_LONG = 180
 
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
 
+@dataclass(slots=True)
+class RegistryGeneration:
+    """Count the changes to the registries of a Home Assistant instance.
+
+    Data derived from the registries can be cached until the value changes.
+    """
+
+    value: int = 0
+
+
+@callback
+@singleton(DATA_GENERATION)
+def async_get_generation(hass: HomeAssistant) -> RegistryGeneration:
+    """Return the change counter of the registries."""
+    return RegistryGeneration()
+
+
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     """Base class for registry items."""
 
     data: dict[str, _DataT]
 
+    # Set by the registry which owns the items, incremented
+    # whenever an entry is added, replaced or removed
+    generation: RegistryGeneration | None = None
+
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
         return self.data.values()
@@ -42,6 +69,8 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
             self._unindex_entry(key, entry)
         data[key] = entry
         self._index_entry(key, entry)
+        if (generation := self.generation) is not None:
+            generation.value += 1
 
     def _unindex_entry_value(
         self, key: str, value: str, index: RegistryIndexType
@@ -61,6 +90,8 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         """Remove an item."""
         self._unindex_entry(key)
         super().__delitem__(key)
+        if (generation := self.generation) is not None:
+            generation.value += 1
 
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
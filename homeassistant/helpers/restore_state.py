@@ -29,9 +29,17 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
+# States which changed since the last full save are saved to the journal
+STORAGE_JOURNAL_KEY = "core.restore_state_journal"
+STORAGE_JOURNAL_VERSION = 1
+
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between saving all the states instead of only
+# the states which changed since the last full save
+STATE_COMPACT_INTERVAL = timedelta(hours=6)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -137,8 +145,17 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_JOURNAL_VERSION, STORAGE_JOURNAL_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and extra data of each entity as last saved to storage
+        self._saved: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        # The stored states saved to the journal since the last full save
+        self._journal: dict[str, dict[str, Any]] = {}
+        self._journal_exists = False
+        self._last_compaction: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,6 +176,12 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        try:
+            journal = await self.journal_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+            journal = None
+
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
@@ -168,6 +191,22 @@ class RestoreStateData:
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
+
+        if journal is not None:
+            self._journal_exists = True
+            # Replay the states saved since the last full save. Entries
+            # older than the full save are left over from a full save
+            # which did not get to remove the journal and are skipped.
+            for item in journal:
+                if not valid_entity_id(entity_id := item["state"]["entity_id"]):
+                    continue
+                stored_state = StoredState.from_dict(item)
+                if (
+                    last_state := self.last_states.get(entity_id)
+                ) is None or stored_state.last_seen >= last_state.last_seen:
+                    self.last_states[entity_id] = stored_state
+
+        if self.last_states:
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
     @callback
@@ -215,17 +254,65 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states which changed since the last save are written
+        to the journal, unless it is time to compact the journal into
+        a full save of all the states.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        saved = self._saved
+        current: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        items: list[dict[str, Any]] = []
+        changed: dict[str, dict[str, Any]] = {}
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            current[state.entity_id] = saved_item = (state, extra_data_dict)
+            item = {
+                "state": state.json_fragment,
+                "extra_data": extra_data_dict,
+                "last_seen": stored_state.last_seen,
+            }
+            items.append(item)
+            if saved.get(state.entity_id) != saved_item:
+                changed[state.entity_id] = item
+
+        journal = self._journal
+        if (
+            self._last_compaction is None
+            or now - self._last_compaction >= STATE_COMPACT_INTERVAL
+            # The journal only has the states which changed
+            # so removing a state requires a full save
+            or not saved.keys() <= current.keys()
+            or len(journal) + len(changed) > len(items) // 2
+        ):
+            try:
+                await self.store.async_save(items)
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
+                return
+            self._saved = current
+            self._last_compaction = now
+            if self._journal_exists:
+                self._journal = {}
+                self._journal_exists = False
+                await self.journal_store.async_remove()
+            return
+
+        if not changed:
+            return
+
+        journal.update(changed)
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.journal_store.async_save(list(journal.values()))
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        self._journal_exists = True
+        saved.update(current)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -63,6 +63,7 @@ from . import (
     translation,
 )
 from .group import expand_entity_ids
+from .registry import async_get_generation
 from .selector import TargetSelector
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
@@ -79,6 +80,10 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "target_resolution_cache"
+)
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 512
 
 
 @cache
@@ -501,31 +506,107 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+@dataclasses.dataclass(slots=True)
+class TargetResolutionCache:
+    """Cache the entities, devices and areas targets resolve to.
+
+    The cache is keyed by the device, area, floor and label ids of
+    the target and is cleared when any registry of the instance changes.
+    """
+
+    generation: int = -1
+    resolved: dict[
+        tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+        SelectedEntities,
+    ] = dataclasses.field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+
+@callback
+def async_get_target_resolution_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return the statistics of the target resolution cache."""
+    if (resolution_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        return {"hits": 0, "misses": 0, "size": 0}
+    return {
+        "hits": resolution_cache.hits,
+        "misses": resolution_cache.misses,
+        "size": len(resolution_cache.resolved),
+    }
+
+
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
     selector = ServiceTargetSelector(service_call)
-    selected = SelectedEntities()
 
     if not selector.has_any_selector:
-        return selected
+        return SelectedEntities()
 
     entity_ids: set[str] | list[str] = selector.entity_ids
     if expand_group:
         entity_ids = expand_entity_ids(hass, entity_ids)
 
-    selected.referenced.update(entity_ids)
-
     if (
         not selector.device_ids
         and not selector.area_ids
         and not selector.floor_ids
         and not selector.label_ids
     ):
-        return selected
+        selected = SelectedEntities()
+    else:
+        selected = _async_resolve_registry_targets(hass, selector)
+
+    selected.referenced.update(entity_ids)
+    return selected
+
 
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target.
+
+    Returns a copy of the cached resolution so the caller may modify it.
+    """
+    if (resolution_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        resolution_cache = hass.data[TARGET_RESOLUTION_CACHE] = TargetResolutionCache()
+    if resolution_cache.generation != (generation := async_get_generation(hass).value):
+        resolution_cache.resolved.clear()
+        resolution_cache.generation = generation
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := resolution_cache.resolved.get(key)) is not None:
+        resolution_cache.hits += 1
+    else:
+        resolution_cache.misses += 1
+        if len(resolution_cache.resolved) >= MAX_TARGET_RESOLUTION_CACHE_SIZE:
+            resolution_cache.resolved.clear()
+        resolved = resolution_cache.resolved[key] = _resolve_registry_targets(
+            hass, selector
+        )
+    return SelectedEntities(
+        indirectly_referenced=set(resolved.indirectly_referenced),
+        missing_devices=set(resolved.missing_devices),
+        missing_areas=set(resolved.missing_areas),
+        missing_floors=set(resolved.missing_floors),
+        missing_labels=set(resolved.missing_labels),
+        referenced_devices=set(resolved.referenced_devices),
+        referenced_areas=set(resolved.referenced_areas),
+    )
+
+
+def _resolve_registry_targets(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target from the registries."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
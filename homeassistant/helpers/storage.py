@@ -12,7 +12,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -33,6 +33,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -48,6 +49,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into a full write once it has more
+# entries than this or a quarter of the entries of the data
+JOURNAL_MIN_COMPACT_ENTRIES = 100
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -89,6 +95,11 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+def _journal_item_key(fragment: json_helper.json_fragment, key: str) -> Any:
+    """Return the key of a journaled item."""
+    return json_util.json_loads_object(json_helper.json_bytes(fragment))[key]
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -241,8 +252,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_keys maps each list in the data to the key of its items.
+        When set, writes which only change a few items of the lists append
+        the changed items to a journal file instead of writing all the data.
+        This requires the items to be json_fragments which are only
+        recreated when the item changes.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +277,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal_keys = journal_keys
+        # The fragments of the items as last written, used by
+        # the executor to find the items which changed
+        self._journal_fragments: dict[str, dict[int, json_helper.json_fragment]] = {}
+        self._journal_token: str | None = None
+        self._journal_entries = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -325,11 +355,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal_keys is not None:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -541,6 +571,67 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> json_util.JsonValueType:
+        """Load the data and replay the journal."""
+        data = json_util.load_json(self.path)
+        if self._journal_keys is not None and isinstance(data, dict):
+            self._replay_journal(data)
+        return data
+
+    def _replay_journal(self, data: Any) -> None:
+        """Apply the changes in the journal to the loaded data."""
+        assert self._journal_keys is not None
+        try:
+            with open(self.journal_path, "rb") as journal_file:
+                lines = journal_file.read().splitlines()
+        except FileNotFoundError:
+            return
+        if not lines or not isinstance(data, dict):
+            return
+        try:
+            journal_token = json_util.json_loads_object(lines[0]).get("journal")
+        except ValueError:
+            # The write of the first line was interrupted
+            _LOGGER.debug("Ignoring unreadable journal for %s", self.key)
+            return
+        # The journal belongs to the data written with the same token,
+        # otherwise it was left behind by an interrupted full write
+        if (token := data.get("journal")) is None or journal_token != token:
+            return
+        try:
+            stored = data["data"]
+            sections = {
+                section: {item[key]: item for item in stored.get(section, [])}
+                for section, key in self._journal_keys.items()
+            }
+        except (KeyError, TypeError, AttributeError) as err:
+            _LOGGER.debug("Ignoring journal for malformed %s: %r", self.key, err)
+            return
+        replayed = 0
+        for line in lines[1:]:
+            try:
+                entry = json_util.json_loads_object(line)
+                items = sections[cast(str, entry["s"])]
+                key = cast(str, entry["k"])
+                if (value := entry["v"]) is None:
+                    items.pop(key, None)
+                else:
+                    items[key] = value
+            except (ValueError, KeyError, TypeError) as err:
+                # The last line may be incomplete if the write was interrupted,
+                # the entries after a malformed entry can not be trusted
+                _LOGGER.debug(
+                    "Stopping replay of the journal for %s at entry %s: %r",
+                    self.key,
+                    replayed + 1,
+                    err,
+                )
+                break
+            replayed += 1
+        for section, items in sections.items():
+            stored[section] = list(items.values())
+        _LOGGER.debug("Replayed %s journal entries for %s", replayed, self.key)
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,6 +642,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal_keys is not None:
+            if self._write_journal(data):
+                return
+            data["journal"] = random_uuid_hex()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +656,96 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal_keys is not None:
+            self._journal_token = data["journal"]
+            self._journal_fragments = self._get_journal_fragments(data["data"]) or {}
+            self._journal_entries = 0
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+
+    def _get_journal_fragments(
+        self, stored: Any
+    ) -> dict[str, dict[int, json_helper.json_fragment]] | None:
+        """Return the fragments of the items by the id of the fragment.
+
+        Returns None if the data can not be journaled.
+        """
+        assert self._journal_keys is not None
+        if not isinstance(stored, dict) or stored.keys() != self._journal_keys.keys():
+            return None
+        journal_fragments: dict[str, dict[int, json_helper.json_fragment]] = {}
+        for section, items in stored.items():
+            fragments = journal_fragments[section] = {
+                id(item): item
+                for item in items
+                if type(item) is json_helper.json_fragment
+            }
+            if len(fragments) != len(items):
+                return None
+        return journal_fragments
+
+    def _write_journal(self, data: dict) -> bool:
+        """Append the items which changed since the last write to the journal.
+
+        Returns False if the data must be written in full instead.
+        """
+        assert self._journal_keys is not None
+        if (
+            self._journal_token is None
+            or not self._journal_fragments
+            or (journal_fragments := self._get_journal_fragments(data["data"])) is None
+        ):
+            return False
+        lines: list[bytes] = []
+        num_items = 0
+        for section, key in self._journal_keys.items():
+            previous = self._journal_fragments[section]
+            current = journal_fragments[section]
+            num_items += len(current)
+            removed_keys = {
+                _journal_item_key(previous[fragment_id], key)
+                for fragment_id in previous.keys() - current.keys()
+            }
+            added = {
+                _journal_item_key(current[fragment_id], key): current[fragment_id]
+                for fragment_id in current.keys() - previous.keys()
+            }
+            lines.extend(
+                json_helper.json_bytes({"s": section, "k": removed_key, "v": None})
+                for removed_key in removed_keys - added.keys()
+            )
+            lines.extend(
+                json_helper.json_bytes({"s": section, "k": added_key, "v": fragment})
+                for added_key, fragment in added.items()
+            )
+        if not lines:
+            return True
+        if self._journal_entries + len(lines) > max(
+            JOURNAL_MIN_COMPACT_ENTRIES, num_items // 4
+        ):
+            return False
+        if not self._journal_entries:
+            lines.insert(0, json_helper.json_bytes({"journal": self._journal_token}))
+        _LOGGER.debug("Appending %s journal entries for %s", len(lines), self.key)
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            with os.fdopen(fd, "wb") as journal_file:
+                journal_file.write(b"\n".join(lines) + b"\n")
+                # The journal entries are only written once, make sure they
+                # reach the disk before the data is considered saved
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+        except OSError as err:
+            _LOGGER.debug("Error writing journal for %s: %s", self.key, err)
+            return False
+        self._journal_fragments = journal_fragments
+        self._journal_entries += len(lines)
+        return True
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +758,6 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_keys is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -5,12 +5,14 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import deque
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
 import math
@@ -21,6 +23,8 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -47,6 +51,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -81,6 +86,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -98,6 +104,14 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_TEMPLATE_CACHE: HassKey[CompiledTemplateCache] = HassKey(
+    "template.compiled_template_cache"
+)
+_RENDER_PROFILER: HassKey[TemplateRenderProfiler] = HassKey("template.render_profiler")
+
+# The number of the most recent render times of a template
+# the render profiler keeps to estimate the 99th percentile
+RENDER_PROFILER_SAMPLES = 100
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -150,6 +164,11 @@ EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
+COMPILED_TEMPLATES_STORAGE_KEY = "core.compiled_templates"
+COMPILED_TEMPLATES_STORAGE_VERSION = 1
+COMPILED_TEMPLATES_SAVE_DELAY = 300
+MAX_COMPILED_TEMPLATES = 10000
+
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
@@ -710,6 +729,11 @@ class Template:
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
+        render_stats: TemplateRenderStats | None = None
+        if (profiler := self.hass.data.get(_RENDER_PROFILER)) is not None:
+            render_stats = profiler.async_count_render(self.template)
+        render_start = perf_counter() if render_stats is not None else 0.0
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(  # noqa: SLF001
@@ -721,6 +745,8 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()  # noqa: SLF001
+        if render_stats is not None:
+            render_stats.add_sample(perf_counter() - render_start, render_info)
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -2711,6 +2737,206 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_compiled_templates(hass: HomeAssistant) -> None:
+    """Load the code of the templates compiled before the last restart."""
+    compiled_template_cache = CompiledTemplateCache(hass)
+    await compiled_template_cache.async_load()
+    hass.data[_COMPILED_TEMPLATE_CACHE] = compiled_template_cache
+
+
+def _compiled_templates_environment() -> str:
+    """Return the versions the generated code of templates depends on."""
+    return f"{sys.implementation.cache_tag}-{jinja2.__version__}-{__version__}"
+
+
+def _compiled_template_key(source: str, environment: str) -> str:
+    """Return the key of the code generated for a template in an environment."""
+    return hashlib.sha256(f"{environment}\0{source}".encode()).hexdigest()
+
+
+class CompiledTemplateCache:
+    """Store the Python code generated for templates so they are not parsed on startup.
+
+    Only the Python source Jinja generates is stored, it is compiled by
+    Python again when loaded. The source is keyed by the hash of the
+    template source and the identity of the TemplateEnvironment which
+    generated it, as Jinja checks the filters and tests exist and folds
+    constants when generating code. It is only used with the same Python,
+    Jinja and Home Assistant versions as it was generated with. Only the
+    templates compiled since the last restart are saved again, so templates
+    which are no longer used are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the compiled template cache."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            COMPILED_TEMPLATES_STORAGE_VERSION,
+            COMPILED_TEMPLATES_STORAGE_KEY,
+            private=True,
+        )
+        self._environment = _compiled_templates_environment()
+        # The generated code of the templates loaded from storage
+        self._stored: dict[str, str] = {}
+        # The generated code of the templates compiled since startup
+        self._compiled: dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored code."""
+        if (data := await self._store.async_load()) and data[
+            "environment"
+        ] == self._environment:
+            self._stored = data["templates"]
+
+    def get(self, source: str, environment: str) -> str | None:
+        """Return the code generated for a template before the last restart."""
+        if threading.get_ident() != self.hass.loop_thread_id:
+            return None
+        key = _compiled_template_key(source, environment)
+        if not isinstance(generated := self._stored.pop(key, None), str):
+            return None
+        self._async_add(key, generated)
+        return generated
+
+    def add(self, source: str, environment: str, generated: str) -> None:
+        """Add the code generated for a template."""
+        if (
+            threading.get_ident() != self.hass.loop_thread_id
+            or len(self._compiled) >= MAX_COMPILED_TEMPLATES
+        ):
+            return
+        self._async_add(_compiled_template_key(source, environment), generated)
+
+    @callback
+    def _async_add(self, key: str, generated: str) -> None:
+        """Add generated code and schedule saving it."""
+        self._compiled[key] = generated
+        self._store.async_delay_save(self._data_to_save, COMPILED_TEMPLATES_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"environment": self._environment, "templates": self._compiled}
+
+
+class TemplateRenderStats:
+    """Render statistics of a template."""
+
+    __slots__ = (
+        "renders",
+        "sampled_renders",
+        "sampled_time",
+        "max_time",
+        "recent_times",
+        "entities",
+        "domains",
+        "all_states",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the render statistics."""
+        self.renders = 0
+        self.sampled_renders = 0
+        self.sampled_time = 0.0
+        self.max_time = 0.0
+        self.recent_times: deque[float] = deque(maxlen=RENDER_PROFILER_SAMPLES)
+        # The fan-out of the last sampled render
+        self.entities = 0
+        self.domains = 0
+        self.all_states = False
+
+    def add_sample(self, render_time: float, render_info: RenderInfo) -> None:
+        """Add the time and the fan-out of a sampled render."""
+        self.sampled_renders += 1
+        self.sampled_time += render_time
+        self.max_time = max(self.max_time, render_time)
+        self.recent_times.append(render_time)
+        self.entities = len(render_info.entities)
+        self.domains = len(render_info.domains | render_info.domains_lifecycle)
+        self.all_states = render_info.all_states or render_info.all_states_lifecycle
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        average_time = (
+            self.sampled_time / self.sampled_renders if self.sampled_renders else 0.0
+        )
+        recent_times = sorted(self.recent_times)
+        p99_time = (
+            recent_times[math.ceil(len(recent_times) * 0.99) - 1]
+            if recent_times
+            else 0.0
+        )
+        return {
+            "renders": self.renders,
+            "sampled_renders": self.sampled_renders,
+            "average_time": average_time,
+            "estimated_total_time": average_time * self.renders,
+            "p99_time": p99_time,
+            "max_time": self.max_time,
+            "entities": self.entities,
+            "domains": self.domains,
+            "all_states": self.all_states,
+        }
+
+
+class TemplateRenderProfiler:
+    """Record how often templates render and how long it takes.
+
+    Every render is counted, but only the first and then one of every
+    sample_interval renders of a template is timed to keep the overhead
+    of the profiler low.
+    """
+
+    def __init__(self, sample_interval: int) -> None:
+        """Initialize the render profiler."""
+        self.sample_interval = sample_interval
+        self._stats: dict[str, TemplateRenderStats] = {}
+
+    @callback
+    def async_count_render(self, template: str) -> TemplateRenderStats | None:
+        """Count a render and return the statistics if it should be timed."""
+        if (stats := self._stats.get(template)) is None:
+            stats = self._stats[template] = TemplateRenderStats()
+        stats.renders += 1
+        if (stats.renders - 1) % self.sample_interval:
+            return None
+        return stats
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return the statistics of the templates, most expensive first."""
+        return sorted(
+            (
+                {"template": template, **stats.as_dict()}
+                for template, stats in self._stats.items()
+            ),
+            key=lambda stats: stats["estimated_total_time"],
+            reverse=True,
+        )
+
+
+@callback
+def async_start_render_profiler(
+    hass: HomeAssistant, sample_interval: int
+) -> TemplateRenderProfiler:
+    """Start recording the render statistics of templates."""
+    profiler = hass.data[_RENDER_PROFILER] = TemplateRenderProfiler(sample_interval)
+    return profiler
+
+
+@callback
+def async_stop_render_profiler(hass: HomeAssistant) -> None:
+    """Stop recording the render statistics of templates."""
+    hass.data.pop(_RENDER_PROFILER, None)
+
+
+@callback
+def async_get_render_profiler(hass: HomeAssistant) -> TemplateRenderProfiler | None:
+    """Return the running render profiler."""
+    return hass.data.get(_RENDER_PROFILER)
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2757,6 +2983,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._limited = bool(limited)
+        self._strict = bool(strict)
+        self._compiled_template_environment: str | None = None
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3064,6 +3293,23 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         return super().is_safe_attribute(obj, attr, value)
 
+    def _get_compiled_template_environment(self) -> str:
+        """Return the identity of the environment for the compiled template cache.
+
+        The code Jinja generates depends on the filters and tests of the
+        environment, which differ between the full and limited environments.
+        """
+        if self._compiled_template_environment is None:
+            self._compiled_template_environment = ",".join(
+                (
+                    f"limited={self._limited}",
+                    f"strict={self._strict}",
+                    *sorted(f"filter:{name}" for name in self.filters),
+                    *sorted(f"test:{name}" for name in self.tests),
+                )
+            )
+        return self._compiled_template_environment
+
     @overload
     def compile(
         self,
@@ -3110,7 +3356,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        compiled: CodeType | None = None
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (
+                compiled_template_cache := self.hass.data.get(_COMPILED_TEMPLATE_CACHE)
+            )
+        ):
+            environment = self._get_compiled_template_environment()
+            if (generated := compiled_template_cache.get(source, environment)) is None:
+                generated = super().compile(source, raw=True)
+                compiled_template_cache.add(source, environment, generated)
+            try:
+                compiled = self._compile(generated, "<template>")
+            except SyntaxError:
+                compiled = super().compile(source)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -132,6 +132,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+# DATA_IMPORT_TIMES is a dict, indicating how long it took to import
+# the integration and platform modules which were not already imported.
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -269,6 +272,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -775,6 +779,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_times = hass.data[DATA_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1064,7 +1069,7 @@ class Integration:
         domain = self.domain
         try:
             cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol, self._timed_import(domain, self.pkg_path)
             )
         except ImportError:
             raise
@@ -1293,7 +1298,26 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._timed_import(
+            f"{self.domain}.{platform_name}", f"{self.pkg_path}.{platform_name}"
+        )
+
+    def _timed_import(self, name: str, module_name: str) -> ModuleType:
+        """Import a module and record how long the import took.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+
+        Only the first import of a module is recorded. The time includes
+        the modules imported by the module which were not imported yet,
+        the same as the cumulative time of python -X importtime.
+        """
+        if module_name in sys.modules:
+            return importlib.import_module(module_name)
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self._import_times.setdefault(name, time.perf_counter() - start)
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -1330,6 +1354,22 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing each integration and platform module took.
+
+    The keys are the domain for integration modules and
+    domain.platform for platform modules.
+    """
+    return dict(
+        sorted(
+            hass.data[DATA_IMPORT_TIMES].items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+    )
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -95,6 +95,7 @@ from homeassistant.helpers.dispatcher import (
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.json import JSONEncoder, _orjson_default_encoder, json_dumps
+from homeassistant.helpers.registry import async_get_generation
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util.async_ import (
     _SHUTDOWN_RUN_CALLBACK_THREADSAFE,
@@ -661,6 +662,7 @@ def mock_registry(
         mock_entries = {}
     registry.deleted_entities = {}
     registry.entities = er.EntityRegistryItems()
+    registry.entities.generation = async_get_generation(hass)
     registry._entities_data = registry.entities.data
     for key, entry in mock_entries.items():
         registry.entities[key] = entry
@@ -686,6 +688,7 @@ def mock_area_registry(
     """
     registry = ar.AreaRegistry(hass)
     registry.areas = ar.AreaRegistryItems()
+    registry.areas.generation = async_get_generation(hass)
     for key, entry in mock_entries.items():
         registry.areas[key] = entry
 
@@ -711,6 +714,7 @@ def mock_device_registry(
     """
     registry = dr.DeviceRegistry(hass)
     registry.devices = dr.ActiveDeviceRegistryItems()
+    registry.devices.generation = async_get_generation(hass)
     registry._device_data = registry.devices.data
     if mock_entries is None:
         mock_entries = {}
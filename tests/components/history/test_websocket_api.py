@@ -543,6 +543,93 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends the historical states in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    last_updated_timestamps: dict[str, float] = {}
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on", attributes={"any": "attr"})
+        last_updated_timestamps[entity_id] = hass.states.get(
+            entity_id
+        ).last_updated_timestamp
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_CHUNK_ENTITIES", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        for entity_ids in (("sensor.one", "sensor.two"), ("sensor.three",)):
+            response = await client.receive_json()
+            assert response == {
+                "event": {
+                    "end_time": pytest.approx(last_updated_timestamps[entity_ids[-1]]),
+                    "start_time": pytest.approx(now.timestamp()),
+                    "states": {
+                        entity_id: [
+                            {
+                                "lu": pytest.approx(last_updated_timestamps[entity_id]),
+                                "s": "on",
+                            }
+                        ]
+                        for entity_id in entity_ids
+                    },
+                },
+                "id": 1,
+                "type": "event",
+            }
+
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/stream",
+                "entity_ids": ["sensor.four", "sensor.five", "sensor.six"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 2
+
+        # An empty response is sent once when none of the chunks have states
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": pytest.approx(end_time.timestamp()),
+                "start_time": pytest.approx(now.timestamp()),
+                "states": {},
+            },
+            "id": 2,
+            "type": "event",
+        }
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1276,6 +1276,152 @@ async def test_measure_sliding_window(
     assert hass.states.get("sensor.sensor4").state == "41.7"
 
 
+async def test_measure_sliding_window_without_database(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a window moving forward drops the old history instead of querying it."""
+    now = dt_util.utcnow()
+    t0 = now - timedelta(minutes=40)
+
+    # Start     t0        Now
+    # |--20min--|--40min--|
+    # |---on----|---off---|
+
+    def _fake_states(*args, **kwargs):
+        return {
+            "binary_sensor.test_id": [
+                ha.State(
+                    "binary_sensor.test_id",
+                    "on",
+                    last_changed=now - timedelta(minutes=60),
+                ),
+                ha.State("binary_sensor.test_id", "off", last_changed=t0),
+            ]
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=_fake_states,
+        ) as state_changes_mock,
+        freeze_time(now),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.33"
+
+        # The state before the new start is the state at the start
+        next_update = now + timedelta(minutes=10)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await hass.async_block_till_done()
+            assert hass.states.get("sensor.sensor1").state == "0.17"
+
+        next_update = now + timedelta(minutes=30)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await hass.async_block_till_done()
+            assert hass.states.get("sensor.sensor1").state == "0.0"
+
+        turn_on_time = now + timedelta(minutes=35)
+        with freeze_time(turn_on_time):
+            hass.states.async_set("binary_sensor.test_id", "on")
+            await hass.async_block_till_done()
+
+        next_update = now + timedelta(minutes=45)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await hass.async_block_till_done()
+            assert hass.states.get("sensor.sensor1").state == "0.17"
+
+    assert state_changes_mock.call_count == 1
+
+
+async def test_measure_sliding_window_lagging_end(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a window ending before now queries the database when it moves."""
+    now = dt_util.utcnow()
+    turn_on_time = now + timedelta(minutes=5)
+    changes = [
+        (now - timedelta(hours=4), "on"),
+        (now - timedelta(hours=2), "off"),
+        (turn_on_time, "on"),
+    ]
+
+    # Start     t0        End       Now
+    # |---1h----|---1h----|---1h----|
+    # |---on----|---off--------|-on-|
+
+    def _fake_states(hass, start, end, entity_id, **kwargs):
+        states = [
+            ha.State("binary_sensor.test_id", state, last_changed=last_changed)
+            for last_changed, state in changes
+            if last_changed < end and last_changed <= dt_util.utcnow()
+        ]
+        start_idx = max(
+            (idx for idx, state in enumerate(states) if state.last_changed <= start),
+            default=0,
+        )
+        return {"binary_sensor.test_id": states[start_idx:]}
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=_fake_states,
+        ),
+        freeze_time(now),
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 10800 }}",
+                        "end": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+        # The state change is after the end of the window
+        with freeze_time(turn_on_time):
+            hass.states.async_set("binary_sensor.test_id", "on")
+            await hass.async_block_till_done()
+
+        # The window moved past the state change
+        next_update = now + timedelta(minutes=90)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await async_wait_recording_done(hass)
+            assert hass.states.get("sensor.sensor1").state == "0.42"
+
+
 async def test_measure_from_end_going_backwards(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -12,7 +12,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
@@ -21,7 +25,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -633,6 +643,56 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics against the wildcard subscription trie."""
+    job = HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, False, job)
+        for topic in (
+            "#",
+            "+/+",
+            "home/#",
+            "home/+/state",
+            "home/kitchen/+",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def _matching(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert _matching("home") == {"#", "home/#"}
+    assert _matching("home/kitchen") == {"#", "+/+", "home/#"}
+    assert _matching("home/kitchen/state") == {
+        "#",
+        "home/#",
+        "home/+/state",
+        "home/kitchen/+",
+    }
+    assert _matching("home/hall/state/extra") == {"#", "home/#"}
+    assert _matching("office/light") == {"#", "+/+"}
+    # Wildcards at the first level should not match topics starting with $
+    assert _matching("$SYS/broker/uptime") == {"$SYS/#"}
+
+    assert trie.has_topic("home/+/state")
+    assert not trie.has_topic("home/+")
+    assert not trie.has_topic("home/kitchen/state")
+
+    trie.remove(subscriptions["home/kitchen/+"])
+    trie.remove(subscriptions["home/+/state"])
+    assert _matching("home/kitchen/state") == {"#", "home/#"}
+    assert not trie.has_topic("home/+/state")
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["home/+/state"])
+
+    for topic in ("#", "+/+", "home/#", "$SYS/#"):
+        trie.remove(subscriptions[topic])
+    assert trie.match("home/kitchen/state") == []
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
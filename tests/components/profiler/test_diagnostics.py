@@ -0,0 +1,37 @@
+"""Test the profiler diagnostics."""
+
+from homeassistant.components.profiler import SERVICE_START_TEMPLATE_PROFILER
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_entry_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test config entry diagnostics."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await get_diagnostics_for_config_entry(hass, hass_client, entry) == {
+        "template_renders": None,
+        "target_resolution_cache": {"hits": 0, "misses": 0, "size": 0},
+    }
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_TEMPLATE_PROFILER, {}, blocking=True
+    )
+    Template("{{ states('sensor.one') }}", hass).async_render_to_info()
+
+    result = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert [
+        (stats["template"], stats["renders"], stats["entities"])
+        for stats in result["template_renders"]
+    ] == [("{{ states('sensor.one') }}", 1, 1)]
@@ -27,16 +27,20 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_TEMPLATE_PROFILER,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_TEMPLATE_PROFILER,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +450,58 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_template_profiler(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test recording the render statistics of templates."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/template_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"running": False, "templates": []}
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_TEMPLATE_PROFILER, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_TEMPLATE_PROFILER, {"sample_interval": 2}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_TEMPLATE_PROFILER, {}, blocking=True
+        )
+
+    tpl = Template("{{ states | count }}", hass)
+    for _ in range(3):
+        tpl.async_render_to_info()
+
+    await client.send_json_auto_id({"type": "profiler/template_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    stats = response["result"]["templates"]
+    assert len(stats) == 1
+    assert stats[0]["template"] == "{{ states | count }}"
+    assert stats[0]["renders"] == 3
+    assert stats[0]["sampled_renders"] == 2
+    assert stats[0]["all_states"] is True
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_TEMPLATE_PROFILER, {}, blocking=True
+    )
+    await client.send_json_auto_id({"type": "profiler/template_stats"})
+    response = await client.receive_json()
+    assert response["result"] == {"running": False, "templates": []}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
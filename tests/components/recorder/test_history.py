@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
@@ -22,6 +23,7 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history.cache import HistoryCache
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -806,6 +808,90 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+def _without_context(
+    hist: dict[str, list[State | dict[str, Any]]],
+) -> dict[str, list[tuple[Any, ...] | dict[str, Any]]]:
+    """Return the history with the states converted to comparable tuples."""
+    return {
+        entity_id: [
+            (
+                state.state,
+                state.attributes,
+                state.last_changed,
+                state.last_updated,
+                state.last_reported,
+            )
+            if isinstance(state, State)
+            else state
+            for state in states
+        ]
+        for entity_id, states in hist.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("significant_changes_only", "minimal_response", "no_attributes"),
+    [
+        (True, False, False),
+        (False, False, False),
+        (True, True, False),
+        (False, False, True),
+    ],
+)
+@pytest.mark.parametrize(
+    "entity_ids",
+    [
+        ["thermostat.test"],
+        ["media_player.test", "media_player.test3", "thermostat.test"],
+    ],
+)
+async def test_get_significant_states_from_history_cache(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test the history cache returns the same states as the database."""
+    instance = get_instance(hass)
+    history_cache = HistoryCache(1000)
+    instance.history_cache = history_cache
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+    assert history_cache.num_rows
+
+    one_and_half = zero + timedelta(seconds=1.5)
+    kwargs = {
+        "entity_ids": entity_ids,
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+    }
+    for start_time, end_time in ((one_and_half, four), (one_and_half, None)):
+        with patch.object(
+            history.modern, "execute_stmt_lambda_element"
+        ) as execute_stmt_mock:
+            hist_from_cache = history.get_significant_states(
+                hass, start_time, end_time, **kwargs
+            )
+        execute_stmt_mock.assert_not_called()
+        instance.history_cache = None
+        hist_from_db = history.get_significant_states(
+            hass, start_time, end_time, **kwargs
+        )
+        instance.history_cache = history_cache
+        assert _without_context(hist_from_cache) == _without_context(hist_from_db)
+
+    # States before the first cached state are read from the database
+    with patch.object(
+        history.modern,
+        "execute_stmt_lambda_element",
+        wraps=history.modern.execute_stmt_lambda_element,
+    ) as execute_stmt_mock:
+        history.get_significant_states(hass, zero, four, **kwargs)
+    assert execute_stmt_mock.call_count == 1
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
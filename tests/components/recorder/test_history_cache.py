@@ -0,0 +1,120 @@
+"""The tests for the recorder history cache."""
+
+from homeassistant.components.recorder.history.cache import (
+    HistoryCache,
+    HistoryCacheRow,
+)
+
+
+def _get_rows(
+    history_cache: HistoryCache,
+    metadata_ids: list[int],
+    start_time_ts: float,
+    end_time_ts: float | None = None,
+) -> list[HistoryCacheRow] | None:
+    """Get the rows of a significant states query including all changes."""
+    return history_cache.get_significant_states_rows(
+        metadata_ids, [], start_time_ts, end_time_ts, False, False, True, 0.0
+    )
+
+
+def test_history_cache_rows() -> None:
+    """Test the rows returned by the history cache."""
+    history_cache = HistoryCache(100)
+    history_cache.add_many(
+        [
+            (1, "on", 10.0, 10.0, '{"a":1}'),
+            (2, "off", 11.0, None, "{}"),
+            (1, "on", 12.0, 10.0, '{"a":2}'),
+            # Committed out of order
+            (1, "off", 11.5, 11.5, '{"a":1}'),
+        ]
+    )
+    assert history_cache.num_rows == 4
+
+    assert _get_rows(history_cache, [1, 2], 11.0) is None
+    assert _get_rows(history_cache, [1, 2], 11.25) == [
+        HistoryCacheRow(1, "on", 0, 0, '{"a":1}'),
+        HistoryCacheRow(1, "off", 11.5, 11.5, '{"a":1}'),
+        HistoryCacheRow(1, "on", 12.0, 10.0, '{"a":2}'),
+        HistoryCacheRow(2, "off", 0, 0, "{}"),
+    ]
+    assert _get_rows(history_cache, [1], 10.5, 12.0) == [
+        HistoryCacheRow(1, "on", 0, 0, '{"a":1}'),
+        HistoryCacheRow(1, "off", 11.5, 11.5, '{"a":1}'),
+    ]
+    # Only significant changes without attributes
+    assert history_cache.get_significant_states_rows(
+        [1], [], 10.5, None, True, True, False, None
+    ) == [HistoryCacheRow(1, "off", 11.5, None, None)]
+    # Entities that were never cached are read from the database
+    assert _get_rows(history_cache, [1, 3], 11.25) is None
+
+
+def test_history_cache_eviction() -> None:
+    """Test the oldest rows are evicted from the history cache."""
+    history_cache = HistoryCache(3)
+    history_cache.add_many(
+        [
+            (1, "1", 1.0, 1.0, None),
+            (2, "2", 2.0, 2.0, None),
+            (1, "3", 3.0, 3.0, None),
+            (1, "4", 4.0, 4.0, None),
+        ]
+    )
+    assert history_cache.num_rows == 3
+    assert _get_rows(history_cache, [1], 2.0) is None
+    assert _get_rows(history_cache, [1], 3.5) == [
+        HistoryCacheRow(1, "3", 0, 0, None),
+        HistoryCacheRow(1, "4", 4.0, 4.0, None),
+    ]
+
+    # The last row of an entity is kept when over max_rows
+    history_cache.add_many([(1, "5", 5.0, 5.0, None), (1, "6", 6.0, 6.0, None)])
+    assert history_cache.num_rows == 3
+    assert _get_rows(history_cache, [1, 2], 5.5) == [
+        HistoryCacheRow(1, "5", 0, 0, None),
+        HistoryCacheRow(1, "6", 6.0, 6.0, None),
+        HistoryCacheRow(2, "2", 0, 0, None),
+    ]
+
+    history_cache.evict_before(5.5)
+    assert history_cache.num_rows == 1
+    assert _get_rows(history_cache, [1, 2], 7.0) is None
+    assert _get_rows(history_cache, [1], 7.0) == [
+        HistoryCacheRow(1, "6", 0, 0, None),
+    ]
+
+    history_cache.clear()
+    assert history_cache.num_rows == 0
+    assert _get_rows(history_cache, [1], 7.0) is None
+
+
+def test_history_cache_eviction_after_purge() -> None:
+    """Test the cache stays within max_rows after purging out of order rows."""
+    history_cache = HistoryCache(5)
+    history_cache.add_many(
+        [
+            (2, "10", 10.0, 10.0, None),
+            (2, "11", 11.0, 11.0, None),
+            (2, "12", 12.0, 12.0, None),
+        ]
+    )
+    # Committed out of order
+    history_cache.add_many([(1, "1", 1.0, 1.0, None), (1, "2", 2.0, 2.0, None)])
+    history_cache.evict_before(5.0)
+    assert history_cache.num_rows == 3
+
+    # Mixed single row and multi row entities
+    for metadata_id in range(3, 7):
+        history_cache.add_many(
+            [(metadata_id, str(metadata_id), 10.0 + metadata_id, None, None)]
+        )
+        assert history_cache.num_rows <= history_cache.max_rows
+    assert _get_rows(history_cache, [2, 3, 4, 5, 6], 16.5) == [
+        HistoryCacheRow(2, "12", 0, 0, None),
+        HistoryCacheRow(3, "3", 0, 0, None),
+        HistoryCacheRow(4, "4", 0, 0, None),
+        HistoryCacheRow(5, "5", 0, 0, None),
+        HistoryCacheRow(6, "6", 0, 0, None),
+    ]
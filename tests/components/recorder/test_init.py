@@ -27,6 +27,7 @@ from homeassistant.components.recorder import (
     CONFIG_SCHEMA,
     DOMAIN,
     Recorder,
+    bulk_insert,
     db_schema,
     get_instance,
     migration,
@@ -136,6 +137,7 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        history_cache_size=0,
     )
 
 
@@ -361,6 +363,121 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test states written in one commit are linked with bulk inserts."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_inserter is not None
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    for entity_id in ("test.one", "test.two"):
+        for state in ("on", "off", "on"):
+            hass.states.async_set(entity_id, state, attributes)
+    hass.bus.async_fire("test_event", {"some": "data"})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("test.one", "off", attributes)
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == [
+            "on",
+            "off",
+            "on",
+            "on",
+            "off",
+            "on",
+            "off",
+        ]
+        states_by_id = {db_state.state_id: db_state for db_state in db_states}
+        test_one = [db_states[0], db_states[1], db_states[2], db_states[6]]
+        test_two = db_states[3:6]
+        for db_states_for_entity in (test_one, test_two):
+            assert db_states_for_entity[0].old_state_id is None
+            for previous, current in zip(
+                db_states_for_entity, db_states_for_entity[1:], strict=False
+            ):
+                assert states_by_id[current.old_state_id] is previous
+        assert len({db_state.metadata_id for db_state in test_one}) == 1
+        assert len({db_state.metadata_id for db_state in test_two}) == 1
+        assert len({db_state.attributes_id for db_state in db_states}) == 1
+        assert session.query(StateAttributes).count() == 1
+
+        db_events = list(
+            session.query(Events)
+            .join(EventTypes)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(db_events) == 1
+        assert db_events[0].event_data_rel.shared_data == '{"some":"data"}'
+
+
+async def test_saving_states_without_bulk_inserts(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test states are written with the unit of work without RETURNING support."""
+    with patch(
+        "homeassistant.components.recorder.core.supports_dialect", return_value=False
+    ):
+        instance = await async_setup_recorder_instance(hass)
+    assert instance._bulk_inserter is None
+
+    for state in ("on", "off", "on"):
+        hass.states.async_set("test.one", state, {"test_attr": 5})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on", "off", "on"]
+        assert db_states[0].old_state_id is None
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[2].old_state_id == db_states[1].state_id
+
+
+async def test_bulk_insert_retry_links_states(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test states are linked when a bulk insert is retried."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_inserter is not None
+    link_old_states = bulk_insert._link_old_states
+    failed = False
+
+    def _fail_once(*args: Any) -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            raise OperationalError("update the states", "fake params", "forced")
+        link_old_states(*args)
+
+    with (
+        patch("time.sleep"),
+        patch.object(
+            bulk_insert, "_link_old_states", side_effect=_fail_once
+        ) as link_old_states_mock,
+    ):
+        for state in ("on", "off", "on"):
+            hass.states.async_set("test.one", state, {"test_attr": 5})
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+    assert link_old_states_mock.call_count == 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on", "off", "on"]
+        assert db_states[0].old_state_id is None
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[2].old_state_id == db_states[1].state_id
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -395,20 +512,15 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    bulk_inserter = get_instance(hass)._bulk_inserter
+
+    def _throw_if_state_pending(*args, **kwargs):
+        if bulk_inserter._pending[States]:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
-        ),
+        patch.object(bulk_inserter, "flush", side_effect=_throw_if_state_pending),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -438,20 +550,15 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    bulk_inserter = get_instance(hass)._bulk_inserter
+
+    def _throw_if_state_pending(*args, **kwargs):
+        if bulk_inserter._pending[States]:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
-        ),
+        patch.object(bulk_inserter, "flush", side_effect=_throw_if_state_pending),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -506,6 +613,26 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
     assert "Error saving events" not in caplog.text
 
 
+async def test_close_drains_event_blocks_from_backlog(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the event blocks drained at close are removed from the backlog."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    await async_block_recorder(hass, 0.5)
+    for idx in range(10):
+        hass.states.async_set("test.recorder", str(idx))
+        hass.states.async_set("test.other", str(idx))
+        await asyncio.sleep(0)
+    assert instance.backlog >= 20
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert instance.backlog == 0
+
+
 async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     """Test saving and restoring an event."""
     event_type = "EVENT_TEST"
@@ -2184,6 +2311,37 @@ async def test_deduplication_state_attributes_inside_commit_interval(
         assert first_attributes_id == last_attributes_id
 
 
+async def test_state_attributes_serialized_once_while_unchanged(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test unchanged state attributes are not serialized again."""
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_mock:
+        for state in ("on", "off", "on"):
+            hass.states.async_set(entity_id, state, attributes)
+        await async_wait_recording_done(hass)
+        assert shared_attrs_bytes_mock.call_count == 1
+
+        hass.states.async_set(entity_id, "off", {"test_attr": 6})
+        await async_wait_recording_done(hass)
+        assert shared_attrs_bytes_mock.call_count == 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(States.attributes_id).order_by(States.last_updated_ts)
+        )
+        assert len(states) == 4
+        assert states[0].attributes_id == states[2].attributes_id
+        assert states[2].attributes_id != states[3].attributes_id
+
+
 async def test_async_block_till_done(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -206,6 +206,32 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge cycle stops once it ran out of time and keeps its progress."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with (
+        patch("homeassistant.components.recorder.purge.PURGE_CYCLE_TIME_BUDGET", 0),
+        patch.object(recorder_mock, "max_bind_vars", 1),
+    ):
+        for cycle in range(1, 5):
+            assert not purge_old_data(recorder_mock, purge_before, repack=False)
+            progress = recorder_mock.purge_progress
+            assert progress is not None
+            assert progress.cycles == cycle
+            assert progress.states == cycle
+            assert progress.as_dict()["purge_before"] == purge_before.isoformat()
+
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+
+    assert recorder_mock.purge_progress is None
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
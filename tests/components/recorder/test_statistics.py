@@ -1,11 +1,12 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
@@ -292,6 +293,142 @@ async def test_compile_hourly_statistics(
     assert stats == {}
 
 
+async def test_compile_hourly_statistics_from_rollup(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the hourly statistics made from the rollup match the database."""
+    instance = recorder.get_instance(hass)
+    zero = get_start_time(dt_util.utcnow()).replace(minute=0) - timedelta(hours=1)
+
+    def _mock_compile_statistics(
+        _hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> PlatformCompiledStatistics:
+        period = int((start - zero).total_seconds() // 300)
+        stats: list[statistics.StatisticResult] = [
+            {
+                "meta": {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": "sensor.mean",
+                    "unit_of_measurement": "dogs",
+                },
+                "stat": {
+                    "start": start,
+                    "mean": period * 1.5,
+                    "min": period - 1.0,
+                    "max": period * 3.0,
+                },
+            },
+            {
+                "meta": {
+                    "has_mean": False,
+                    "has_sum": True,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": "sensor.sum",
+                    "unit_of_measurement": "cats",
+                },
+                "stat": {
+                    "start": start,
+                    "last_reset": zero,
+                    "state": period * 2.0,
+                    "sum": period * 4.0,
+                },
+            },
+        ]
+        if period % 2:
+            # A statistic which is not compiled for every period
+            stats.append(
+                {
+                    "meta": {
+                        "has_mean": True,
+                        "has_sum": False,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.sometimes",
+                        "unit_of_measurement": None,
+                    },
+                    "stat": {"start": start, "mean": period, "min": 0, "max": period},
+                }
+            )
+        return PlatformCompiledStatistics(
+            stats,
+            get_metadata_with_session(
+                instance,
+                session,
+                statistic_ids={"sensor.mean", "sensor.sum", "sensor.sometimes"},
+            ),
+        )
+
+    recorder_platform = Mock(
+        compile_statistics=Mock(wraps=_mock_compile_statistics),
+        list_statistic_ids=Mock(return_value={}),
+        validate_statistics=Mock(return_value={}),
+    )
+    await _setup_mock_domain(hass, recorder_platform)
+    await async_recorder_block_till_done(hass)
+
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary",
+        wraps=statistics._compile_hourly_statistics_summary,
+    ) as compile_summary_mock:
+        for period in range(12):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * period))
+        await async_wait_recording_done(hass)
+    compile_summary_mock.assert_not_called()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        from_db = statistics._compile_hourly_statistics_summary(session, zero)
+    from_rollup = instance.hourly_statistics_rollup.get_summary(zero)
+    assert len(from_db) == 3
+    assert from_rollup.keys() == from_db.keys()
+    for metadata_id, summary_item in from_db.items():
+        assert {
+            key: pytest.approx(value)
+            for key, value in summary_item.items()
+            if value is not None
+        } == {
+            key: value
+            for key, value in from_rollup[metadata_id].items()
+            if value is not None
+        }
+
+    stats = statistics_during_period(hass, zero, period="hour")
+    assert stats["sensor.mean"] == [
+        {
+            "start": zero.timestamp(),
+            "end": (zero + timedelta(hours=1)).timestamp(),
+            "mean": pytest.approx(8.25),
+            "min": pytest.approx(-1.0),
+            "max": pytest.approx(33.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        }
+    ]
+    assert stats["sensor.sum"] == [
+        {
+            "start": zero.timestamp(),
+            "end": (zero + timedelta(hours=1)).timestamp(),
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset": zero.timestamp(),
+            "state": pytest.approx(22.0),
+            "sum": pytest.approx(44.0),
+        }
+    ]
+
+    # The hourly statistics are compiled from the database
+    # when not all periods of the hour were rolled up
+    instance.hourly_statistics_rollup.reset()
+    assert instance.hourly_statistics_rollup.get_summary(zero) is None
+
+
 @pytest.fixture
 def mock_sensor_statistics():
     """Generate some fake statistics."""
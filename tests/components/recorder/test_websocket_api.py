@@ -2472,15 +2472,41 @@ async def test_recorder_info(
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == {
+        "average_event_block_size": ANY,
         "backlog": 0,
+        "event_latency": ANY,
         "max_backlog": 65000,
+        "max_event_block_size": ANY,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
     }
 
 
+async def test_recorder_info_event_blocks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the events of one event loop iteration are handed off in one block."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    for idx in range(100):
+        hass.states.async_set("sensor.burst", str(idx))
+    assert recorder_mock.backlog >= 100
+    await async_wait_recording_done(hass)
+    assert hass.states.get("sensor.burst").state == "99"
+
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["backlog"] == 0
+    assert response["result"]["max_event_block_size"] >= 100
+    assert response["result"]["average_event_block_size"] > 1
+    assert response["result"]["event_latency"] >= 0
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 import math
 from statistics import mean
+import threading
 from typing import Any, Literal
 from unittest.mock import patch
 
@@ -17,6 +18,7 @@ from homeassistant.components.recorder import (
     Recorder,
     history,
 )
+from homeassistant.components.recorder.const import DB_WORKER_PREFIX
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
@@ -34,7 +36,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -247,6 +254,65 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_compile_hourly_statistics_in_db_workers(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the history of the sensors is fetched in chunks in the database workers."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    entity_ids = ["sensor.test1", "sensor.test2", "sensor.test3"]
+    with freeze_time(zero) as freezer:
+        for entity_id in entity_ids:
+            freezer.move_to(zero)
+            await async_record_states(
+                hass, freezer, zero, entity_id, POWER_SENSOR_ATTRIBUTES
+            )
+    await async_wait_recording_done(hass)
+
+    threads: list[str] = []
+    original = sensor_recorder._get_entities_with_float_states
+
+    def _get_entities_with_float_states(*args: Any) -> Any:
+        threads.append(threading.current_thread().name)
+        return original(*args)
+
+    with (
+        patch.object(sensor_recorder, "COMPILE_STATISTICS_CHUNK_SIZE", 1),
+        patch.object(
+            sensor_recorder,
+            "_get_entities_with_float_states",
+            _get_entities_with_float_states,
+        ),
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    assert len(threads) == 3
+    assert all(name.startswith(DB_WORKER_PREFIX) for name in threads)
+    stats = await hass.async_add_executor_job(
+        statistics_during_period, hass, zero, None, None, "5minute"
+    )
+    assert stats == {
+        entity_id: [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(13.050847),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+        for entity_id in entity_ids
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -0,0 +1,106 @@
+"""The tests for the running aggregates of the statistics sensor."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.rolling import RollingStatistics
+from homeassistant.util import dt as dt_util
+
+
+def test_rolling_statistics_match_full_recalculation() -> None:
+    """Test the running aggregates match the aggregates of the whole buffer."""
+    rolling = RollingStatistics(50)
+    rng = random.Random(42)
+    now = dt_util.utcnow()
+
+    for sample in range(500):
+        rolling.append(round(rng.uniform(-100, 100), 1), now)
+        now += timedelta(seconds=rng.randint(1, 60))
+        if sample % 7 == 0:
+            rolling.popleft()
+        if len(rolling.states) < 2:
+            continue
+
+        states = list(rolling.states)
+        ages = list(rolling.ages)
+        pairs = list(zip(states, states[1:], strict=False))
+        segments = [
+            (ages[idx] - ages[idx - 1]).total_seconds() for idx in range(1, len(ages))
+        ]
+        assert len(states) <= 50
+        assert rolling.sorted_states == sorted(states)
+        assert rolling.sum == pytest.approx(sum(states))
+        assert rolling.variance == pytest.approx(statistics.variance(states))
+        assert rolling.median == statistics.median(states)
+        for percentile in (1, 25, 50, 99):
+            assert rolling.percentile(percentile) == pytest.approx(
+                statistics.quantiles(states, n=100, method="exclusive")[percentile - 1]
+            )
+        assert rolling.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in pairs)
+        )
+        assert rolling.sum_differences_nonnegative == pytest.approx(
+            sum(j - i if j >= i else j for i, j in pairs)
+        )
+        assert rolling.area_step == pytest.approx(
+            sum(
+                value * seconds
+                for value, seconds in zip(states, segments, strict=False)
+            )
+        )
+        assert rolling.area_linear == pytest.approx(
+            sum(
+                0.5 * (i + j) * seconds
+                for (i, j), seconds in zip(pairs, segments, strict=True)
+            )
+        )
+        assert math.atan2(rolling.sin_sum, rolling.cos_sum) == pytest.approx(
+            math.atan2(
+                sum(math.sin(math.radians(x)) for x in states),
+                sum(math.cos(math.radians(x)) for x in states),
+            )
+        )
+
+
+def test_rolling_statistics_binary() -> None:
+    """Test the running aggregates of binary samples."""
+    rolling = RollingStatistics(3)
+    now = dt_util.utcnow()
+    for seconds, value in enumerate((True, False, True, True)):
+        rolling.append(value, now + timedelta(seconds=seconds * 10))
+
+    assert list(rolling.states) == [False, True, True]
+    assert rolling.count_on == 2
+    assert rolling.area_step == 10
+
+    rolling.popleft()
+    rolling.popleft()
+    rolling.popleft()
+    assert not rolling.states
+    assert rolling.count_on == 0
+    assert rolling.area_step == 0
+
+
+@pytest.mark.parametrize("value", [math.inf, -math.inf, math.nan])
+def test_rolling_statistics_reject_non_finite(value: float) -> None:
+    """Test non-finite samples are rejected without changing the aggregates."""
+    rolling = RollingStatistics(3)
+    now = dt_util.utcnow()
+    rolling.append(1.0, now)
+
+    with pytest.raises(ValueError):
+        rolling.append(value, now + timedelta(seconds=10))
+
+    assert list(rolling.states) == [1.0]
+    assert list(rolling.ages) == [now]
+    assert rolling.sorted_states == [1.0]
+    assert rolling.sum == 1.0
+    rolling.popleft()
+    assert not rolling.states
+    assert rolling.sum == 0
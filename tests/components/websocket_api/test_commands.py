@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -19,7 +20,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -27,6 +28,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1198,6 +1201,192 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_share_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    other_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+    await other_client.send_json({"id": 7, "type": "subscribe_entities"})
+    for client in (websocket_client, other_client):
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on")
+    msg = await other_client.receive_json()
+    assert msg["event"] == {"c": {"light.two": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+    for client in (other_client, websocket_client):
+        msg = await client.receive_json()
+        assert msg["event"] == {
+            "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    await other_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await other_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_rate_limit(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the changes during the rate limit window are merged into one diff."""
+    hass.states.async_set("light.one", "off")
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one"],
+            "rate_limit": 10,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {"light.one": ANY}}
+
+    # The first change is sent right away
+    hass.states.async_set("light.one", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    # The changes during the window are held back
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.one", "on", {"effect": "help"})
+    await websocket_client.send_json({"id": 8, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"a": {"effect": "help"}, "c": ANY, "lc": ANY}}}
+    }
+
+    # Removing and adding again during the window is merged into the removal
+    hass.states.async_remove("light.one")
+    hass.states.async_set("light.one", "on")
+    hass.states.async_remove("light.one")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=22))
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.one"]}
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+
+
+async def test_subscribe_entities_resume(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test resuming a subscription only sends the missed changes."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one"],
+            "resumable": True,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"resumed": False}
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {"light.one": ANY}}
+    seq = msg["seq"]
+
+    hass.states.async_set("light.one", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == seq + 1
+    assert msg["event"] == {"c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+    last_seq = msg["seq"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Changes while the client is away are kept for the client to resume
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "off")
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json(
+        {
+            "id": 9,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one"],
+            "resume_from": last_seq,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"resumed": True}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["seq"] == last_seq + 2
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+    # An unknown sequence sends all states again
+    await websocket_client.send_json(
+        {
+            "id": 10,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one"],
+            "resume_from": 1,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"resumed": False}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert msg["seq"] == last_seq + 2
+    assert msg["event"] == {"a": {"light.one": ANY}}
+
+    # Resuming can not be combined with a rate limit
+    await websocket_client.send_json(
+        {
+            "id": 11,
+            "type": "subscribe_entities",
+            "resumable": True,
+            "rate_limit": 1,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2515,6 +2704,30 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test the import times of integration modules."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_timings",
+        return_value={
+            "hue": 1.5,
+            "hue.light": 0.25,
+        },
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "hue", "seconds": 1.5},
+        {"module": "hue.light", "seconds": 0.25},
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -14,12 +14,23 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -433,6 +444,33 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_permessage_deflate(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test permessage-deflate is negotiated and large frames are compressed."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    await hass.async_block_till_done()
+    for idx in range(500):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"unit": "W"})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(URL, compress=15) as ws:
+        assert ws.compress == 15
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        await ws.send_json({"id": 5, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["id"] == 5
+        assert msg["success"]
+        assert len(msg["result"]) == 500
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1756,6 +1756,86 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_batched_renders(hass: HomeAssistant) -> None:
+    """Test re-renders for state changes are batched and yield to the loop."""
+    runs: list[tuple[int, str, str] | str] = []
+
+    def _make_callback(idx: int) -> Callable[..., None]:
+        @callback
+        def _run_callback(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            assert event is not None
+            runs.append((idx, event.data["new_state"].state, updates.pop().result))
+            if idx == 0:
+                hass.loop.call_soon(runs.append, "yielded")
+
+        return _run_callback
+
+    hass.states.async_set("sensor.test", "a")
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.test') }}", hass), None)],
+            _make_callback(idx),
+            batch_renders=True,
+        )
+        for idx in range(3)
+    ]
+    await hass.async_block_till_done()
+
+    # Only the last state change of the entity is rendered
+    hass.states.async_set("sensor.test", "b")
+    hass.states.async_set("sensor.test", "c")
+    assert runs == []
+    await hass.async_block_till_done()
+    assert runs == [(0, "c", "c"), (1, "c", "c"), (2, "c", "c"), "yielded"]
+
+    # The renders yield to the loop once the time slice is used up
+    runs.clear()
+    with patch("homeassistant.helpers.event.TEMPLATE_RENDER_SLICE_TIME", 0):
+        hass.states.async_set("sensor.test", "d")
+        await hass.async_block_till_done()
+    assert runs == [(0, "d", "d"), "yielded", (1, "d", "d"), (2, "d", "d")]
+
+    # Removed trackers are not rendered anymore
+    runs.clear()
+    hass.states.async_set("sensor.test", "e")
+    infos[1].async_remove()
+    await hass.async_block_till_done()
+    assert runs == [(0, "e", "e"), (2, "e", "e"), "yielded"]
+
+
+async def test_track_template_result_renders_every_state_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test every state change is rendered when renders are not batched."""
+    runs: list[tuple[str, str]] = []
+
+    @callback
+    def _run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        assert event is not None
+        runs.append((event.data["new_state"].state, updates.pop().result))
+
+    hass.states.async_set("sensor.test", "a")
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.test') }}", hass), None)],
+        _run_callback,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "b")
+    hass.states.async_set("sensor.test", "c")
+    await hass.async_block_till_done()
+    # The change to b is not collapsed into the change to c
+    assert runs == [("b", "c")]
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
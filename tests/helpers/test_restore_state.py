@@ -17,6 +17,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_COMPACT_INTERVAL,
+    STORAGE_JOURNAL_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -131,6 +133,10 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    # Only changed states are saved, so change the state before each dump
+    data.async_restore_entity_added(entity)
+
+    hass.states.async_set("input_boolean.b1", "1")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -139,6 +145,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "2")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -147,6 +154,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "3")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -180,6 +188,10 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Startup Save
     assert mock_write_data.called
 
+    # Only changed states are saved, so change the state before each dump
+    data.async_restore_entity_added(entity)
+
+    hass.states.async_set("input_boolean.b1", "4")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -189,6 +201,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Not quite the first interval
     assert not mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "5")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -197,6 +210,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "6")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -205,6 +219,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "7")
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -358,6 +373,84 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states_to_journal(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only the changed states are saved between full saves."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    with patch("homeassistant.helpers.restore_state.dt_util.utcnow", return_value=now):
+        await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+
+    # Nothing changed so nothing is saved
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    assert not mock_write_data.called
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+    journal = hass_storage[STORAGE_JOURNAL_KEY]["data"]
+    assert len(journal) == 1
+    assert json_round_trip(journal[0])["state"]["state"] == "off"
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+
+    # The journal is replayed on load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_get(hass).async_load()
+    last_states = async_get(hass).last_states
+    assert {
+        entity_id: stored_state.state.state
+        for entity_id, stored_state in last_states.items()
+    } == {
+        "input_boolean.b0": "on",
+        "input_boolean.b1": "off",
+        "input_boolean.b2": "on",
+        "input_boolean.b3": "on",
+    }
+
+    # Changing more than half of the states saves all of them
+    hass.states.async_set("input_boolean.b2", "off")
+    hass.states.async_set("input_boolean.b3", "off")
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=now + timedelta(minutes=15),
+    ):
+        await data.async_dump_states()
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+    assert [
+        json_round_trip(item)["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["on", "off", "off", "off"]
+
+    # All the states are saved after the compact interval
+    hass.states.async_set("input_boolean.b0", "off")
+    with patch(
+        "homeassistant.helpers.restore_state.dt_util.utcnow",
+        return_value=now + timedelta(minutes=15) + STATE_COMPACT_INTERVAL,
+    ):
+        await data.async_dump_states()
+    assert STORAGE_JOURNAL_KEY not in hass_storage
+    assert [
+        json_round_trip(item)["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["off", "off", "off", "off"]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -749,6 +749,40 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_target_resolution_cache(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the resolved targets are cached until a registry changes."""
+    call = ServiceCall("light", "turn_on", {"floor_id": "test-floor"})
+    expected = {"light.in_area", "light.assigned_to_area"}
+
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    cache = hass.data[service.TARGET_RESOLUTION_CACHE]
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # The cached resolution is copied so callers can modify it
+    referenced = service.async_extract_referenced_entity_ids(hass, call)
+    referenced.indirectly_referenced.add("light.added")
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    entity_registry.async_update_entity("light.no_area", area_id="test-area")
+    assert await service.async_extract_entity_ids(hass, call) == {
+        *expected,
+        "light.no_area",
+    }
+    assert (cache.hits, cache.misses) == (3, 2)
+    assert service.async_get_target_resolution_stats(hass) == {
+        "hits": 3,
+        "misses": 2,
+        "size": 1,
+    }
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
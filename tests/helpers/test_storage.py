@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -667,6 +668,161 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changed items are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = {
+            str(idx): json_fragment(json_bytes({"id": str(idx), "value": idx}))
+            for idx in range(400)
+        }
+
+        def _data_to_save() -> dict[str, Any]:
+            return {"items": list(items.values())}
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        store.async_delay_save(_data_to_save)
+        await store._async_handle_write_data()
+        assert not os.path.exists(store.journal_path)
+
+        items["1"] = json_fragment(json_bytes({"id": "1", "value": "changed"}))
+        del items["2"]
+        items["new"] = json_fragment(json_bytes({"id": "new", "value": "new"}))
+        store.async_delay_save(_data_to_save)
+        await store._async_handle_write_data()
+
+        journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+        # The token line and one line for each changed item
+        assert len(journal.splitlines()) == 4
+
+        def _expected_data() -> dict[str, Any]:
+            return {"items": [json.loads(json_bytes(item)) for item in items.values()]}
+
+        load = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        ).async_load()
+        assert load == _expected_data()
+
+        # Changing more than a quarter of the items writes all the data
+        for idx in range(100, 250):
+            items[str(idx)] = json_fragment(json_bytes({"id": str(idx), "value": 0}))
+        store.async_delay_save(_data_to_save)
+        await store._async_handle_write_data()
+        assert not os.path.exists(store.journal_path)
+
+        # A journal left behind by an interrupted full write is not replayed
+        await hass.async_add_executor_job(
+            Path(store.journal_path).write_bytes,
+            journal,
+        )
+        load = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        ).async_load()
+        assert load == _expected_data()
+
+        await store.async_remove()
+        assert not os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def _async_store_with_journal(
+    hass: HomeAssistant, lines: list[bytes] | None
+) -> storage.Store:
+    """Write the data of a journaled store and a journal with the lines."""
+    items = [{"id": str(idx), "value": idx} for idx in range(2)]
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"})
+    store.async_delay_save(
+        lambda: {"items": [json_fragment(json_bytes(item)) for item in items]}
+    )
+    await store._async_handle_write_data()
+    stored = json.loads(await hass.async_add_executor_job(Path(store.path).read_text))
+    token_line = json_bytes({"journal": stored["journal"]})
+    await hass.async_add_executor_job(
+        Path(store.journal_path).write_bytes,
+        b"\n".join([token_line, *lines] if lines is not None else [token_line[:5]]),
+    )
+    return storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"})
+
+
+async def test_journal_truncated_token_line(tmpdir: py.path.local) -> None:
+    """Test a journal with an incomplete first line is ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = await _async_store_with_journal(hass, None)
+        assert await store.async_load() == {
+            "items": [{"id": "0", "value": 0}, {"id": "1", "value": 1}]
+        }
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    "malformed_entry",
+    [
+        b'{"s":"items","k":"0"}',
+        b'{"s":"unknown","k":"0","v":null}',
+        b'{"s":"items","k":["0"],"v":null}',
+        b"[]",
+        b'{"s":"items","k":"0","v":',
+    ],
+)
+async def test_journal_malformed_entry(
+    tmpdir: py.path.local, malformed_entry: bytes
+) -> None:
+    """Test the journal is replayed up to a malformed entry."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = await _async_store_with_journal(
+            hass,
+            [
+                b'{"s":"items","k":"1","v":{"id":"1","value":"changed"}}',
+                malformed_entry,
+                b'{"s":"items","k":"0","v":null}',
+            ],
+        )
+        assert await store.async_load() == {
+            "items": [{"id": "0", "value": 0}, {"id": "1", "value": "changed"}]
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_malformed_data(tmpdir: py.path.local) -> None:
+    """Test the journal is ignored when the stored items can not be keyed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        await hass.async_add_executor_job(os.makedirs, os.path.dirname(store.path))
+        await hass.async_add_executor_job(
+            Path(store.path).write_bytes,
+            json_bytes(
+                {
+                    "version": MOCK_VERSION,
+                    "minor_version": 1,
+                    "key": MOCK_KEY,
+                    "data": {"items": [{"value": 0}]},
+                    "journal": "token",
+                }
+            ),
+        )
+        await hass.async_add_executor_job(
+            Path(store.journal_path).write_bytes,
+            b'{"journal":"token"}\n{"s":"items","k":"0","v":null}\n',
+        )
+        assert await store.async_load() == {"items": [{"value": 0}]}
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -5169,6 +5170,82 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code generated for templates is stored across restarts."""
+    template_string = "{{ 40 + 2 }}"
+    await template.async_load_compiled_templates(hass)
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == 42
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILED_TEMPLATES_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.COMPILED_TEMPLATES_STORAGE_KEY]["data"]
+    assert len(stored["templates"]) == 1
+    # Only the Python source generated by Jinja is stored
+    (generated,) = stored["templates"].values()
+    assert "def root(" in generated
+
+    async def _async_restart() -> None:
+        """Drop the environments and the cache as a restart would."""
+        for key in (template._ENVIRONMENT, template._COMPILED_TEMPLATE_CACHE):
+            hass.data.pop(key)
+        await template.async_load_compiled_templates(hass)
+
+    del tpl
+    await _async_restart()
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == 42
+    assert not mock_compile.called
+
+    # Code compiled by other versions is not used
+    stored["environment"] = "cpython-311-3.0.0-2020.1.0"
+    del tpl
+    await _async_restart()
+    with patch.object(
+        jinja2.Environment,
+        "compile",
+        autospec=True,
+        side_effect=jinja2.Environment.compile,
+    ) as mock_compile:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == 42
+    assert mock_compile.called
+
+
+async def test_compiled_template_cache_per_environment(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code compiled by one environment is not used by another one."""
+    template_string = "{{ 'sensor.test' is is_state('on') }}"
+    await template.async_load_compiled_templates(hass)
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() is False
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILED_TEMPLATES_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.COMPILED_TEMPLATES_STORAGE_KEY]["data"]
+    assert len(stored["templates"]) == 1
+
+    del tpl
+    for key in (template._ENVIRONMENT, template._COMPILED_TEMPLATE_CACHE):
+        hass.data.pop(key)
+    await template.async_load_compiled_templates(hass)
+
+    # The limited environment has no is_state test
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    with pytest.raises(jinja2.TemplateAssertionError):
+        limited_env.compile(template_string)
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5604,6 +5681,47 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_profiler(hass: HomeAssistant) -> None:
+    """Test the render profiler counts renders and samples their time."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "20")
+    entity_template = template.Template(
+        "{{ states('light.kitchen') }} {{ states('sensor.temperature') }}", hass
+    )
+    all_states_template = template.Template("{{ states | count }}", hass)
+
+    entity_template.async_render_to_info()
+    assert template.async_get_render_profiler(hass) is None
+
+    profiler = template.async_start_render_profiler(hass, 2)
+    assert template.async_get_render_profiler(hass) is profiler
+    for _ in range(5):
+        entity_template.async_render_to_info()
+    all_states_template.async_render_to_info()
+
+    stats = {stats["template"]: stats for stats in profiler.async_get_stats()}
+    entity_stats = stats[entity_template.template]
+    all_states_stats = stats[all_states_template.template]
+    assert entity_stats["renders"] == 5
+    assert entity_stats["sampled_renders"] == 3
+    assert entity_stats["entities"] == 2
+    assert entity_stats["domains"] == 0
+    assert entity_stats["all_states"] is False
+    assert 0 < entity_stats["average_time"] <= entity_stats["max_time"]
+    assert entity_stats["p99_time"] == entity_stats["max_time"]
+    assert entity_stats["estimated_total_time"] == pytest.approx(
+        entity_stats["average_time"] * 5
+    )
+    assert all_states_stats["renders"] == 1
+    assert all_states_stats["sampled_renders"] == 1
+    assert all_states_stats["all_states"] is True
+
+    template.async_stop_render_profiler(hass)
+    assert template.async_get_render_profiler(hass) is None
+    entity_template.async_render_to_info()
+    assert profiler.async_get_stats() == list(stats.values())
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
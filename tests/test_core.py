@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1492,6 +1493,39 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_all_as_dict_json(hass: HomeAssistant) -> None:
+    """Test the JSON of all states only serializes the changed domains again."""
+    assert hass.states.async_all_as_dict_json() == b"[]"
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.fan", "off")
+    hass.states.async_set("light.ceiling", "off")
+
+    def _expected() -> list[dict[str, Any]]:
+        return [
+            state.as_dict()
+            for domain in ("light", "switch")
+            for state in hass.states.async_all(domain)
+        ]
+
+    assert json_loads(hass.states.async_all_as_dict_json()) == _expected()
+
+    with patch.object(
+        ha.State, "as_dict_json", PropertyMock(side_effect=ValueError)
+    ) as mock_as_dict_json:
+        hass.states.async_all_as_dict_json()
+        hass.states.async_set("switch.fan", "on")
+        with pytest.raises(ValueError):
+            hass.states.async_all_as_dict_json()
+    # Only the state of the changed domain was serialized again
+    assert mock_as_dict_json.call_count == 1
+
+    assert json_loads(hass.states.async_all_as_dict_json()) == _expected()
+
+    hass.states.async_remove("switch.fan")
+    assert json_loads(hass.states.async_all_as_dict_json()) == _expected()
+    assert len(_expected()) == 2
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
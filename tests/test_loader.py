@@ -1034,6 +1034,48 @@ async def test_import_platform_executor(hass: HomeAssistant) -> None:
     assert await config_flow_task1_result._async_has_devices(hass) is True
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_import_timings(hass: HomeAssistant) -> None:
+    """Test the time it took to import modules is recorded."""
+    integration = await loader.async_get_integration(hass, "test_package")
+    module_mock = MagicMock()
+    platform_mock = MagicMock()
+    modules = {
+        integration.pkg_path: module_mock,
+        f"{integration.pkg_path}.light": platform_mock,
+    }
+
+    def import_module(name: str) -> Any:
+        sys.modules[name] = modules[name]
+        return modules[name]
+
+    with (
+        patch.dict("sys.modules"),
+        patch("homeassistant.loader.importlib.import_module", import_module),
+    ):
+        assert await integration.async_get_component() is module_mock
+        assert await integration.async_get_platform("light") is platform_mock
+
+    import_timings = loader.async_get_import_timings(hass)
+    assert import_timings.keys() == {"test_package", "test_package.light"}
+    assert all(seconds >= 0 for seconds in import_timings.values())
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_import_timings_already_imported(hass: HomeAssistant) -> None:
+    """Test modules imported before the integration loaded them are not recorded."""
+    integration = await loader.async_get_integration(hass, "test_package")
+    module_mock = MagicMock()
+
+    with (
+        patch.dict("sys.modules", {integration.pkg_path: module_mock}),
+        patch("homeassistant.loader.importlib.import_module", return_value=module_mock),
+    ):
+        assert await integration.async_get_component() is module_mock
+
+    assert loader.async_get_import_timings(hass) == {}
+
+
 async def test_get_custom_components_recovery_mode(hass: HomeAssistant) -> None:
     """Test that we get empty custom components in recovery mode."""
     hass.config.recovery_mode = True